@@ -11,6 +11,8 @@ helper_snapshots: dict[int, HelperSurroundingsSnapshot] = {}
 animals_in_flocks: set[Animal] = set()
 # Track animals being chased (animal -> helper_id)
 animals_being_chased: dict[Animal, int] = {}
+# Union of the two above, rebuilt once per turn for cheap filtering
+_unavailable_animals: set[Animal] = set()
 
 # global patrol strips for dynamic reassignment
 _PATROL_STRIPS: list[dict] = []
@@ -19,6 +21,20 @@ _PATROL_STRIPS: list[dict] = []
 GRID_WIDTH = 1000
 GRID_HEIGHT = 1000
 
+# random moves are retried this many times before falling back to fixed steps
+RANDOM_MOVE_ATTEMPTS = 4
+# the 8 cardinal/diagonal steps, same magnitude as a random move
+FALLBACK_MOVE_OFFSETS = (
+    (0.5, 0.0),
+    (-0.5, 0.0),
+    (0.0, 0.5),
+    (0.0, -0.5),
+    (0.5, 0.5),
+    (0.5, -0.5),
+    (-0.5, 0.5),
+    (-0.5, -0.5),
+)
+
 
 class Player6(Player):
     def __init__(
@@ -84,6 +100,8 @@ class Player6(Player):
         self._patrol_row_step = self._patrol_spacing
         self._patrol_dir = helper_id % 2 == 0
         self._patrol_active = True
+        # (end_x, row_y) of the current row, invalidated on row/strip change
+        self._cached_patrol_target: tuple[float, float] | None = None
 
     def check_surroundings(self, snapshot: HelperSurroundingsSnapshot) -> int:
         self._update_snapshot(snapshot)
@@ -98,7 +116,7 @@ class Player6(Player):
 
     def _update_global_animal_tracking(self) -> None:
         """Update global tracking of animals in flocks and being chased."""
-        global animals_in_flocks, animals_being_chased
+        global animals_in_flocks, animals_being_chased, _unavailable_animals
 
         # Rebuild set of all animals currently in any flock
         animals_in_flocks = set()
@@ -112,14 +130,21 @@ class Player6(Player):
             if animal not in animals_in_flocks
         }
 
+        _unavailable_animals = animals_in_flocks | animals_being_chased.keys()
+
     def _get_random_move(self) -> tuple[float, float]:
         old_x, old_y = self.position
-        dx, dy = random() - 0.5, random() - 0.5
 
-        while not (self.can_move_to(old_x + dx, old_y + dy)):
+        for _ in range(RANDOM_MOVE_ATTEMPTS):
             dx, dy = random() - 0.5, random() - 0.5
+            if self.can_move_to(old_x + dx, old_y + dy):
+                return old_x + dx, old_y + dy
 
-        return old_x + dx, old_y + dy
+        for dx, dy in FALLBACK_MOVE_OFFSETS:
+            if self.can_move_to(old_x + dx, old_y + dy):
+                return old_x + dx, old_y + dy
+
+        return old_x, old_y
 
     def get_action(self, messages) -> Move | Obtain | None:
         if self.kind == Kind.Noah:
@@ -165,7 +190,11 @@ class Player6(Player):
 
         unclaimed_animals = self._get_unclaimed_animals(cellview.animals)
         if unclaimed_animals:
-            random_animal = choice(tuple(unclaimed_animals))
+            # only materialize the set when there is an actual choice to make
+            if len(unclaimed_animals) == 1:
+                random_animal = next(iter(unclaimed_animals))
+            else:
+                random_animal = choice(tuple(unclaimed_animals))
             print(
                 f"[Helper {self.id}] Attempting Obtain at ({cur_x}, {cur_y}), flock: {len(self.flock)}"
             )
@@ -175,9 +204,7 @@ class Player6(Player):
 
     def _get_unclaimed_animals(self, animals: set[Animal]) -> set[Animal]:
         """Filter animals to only those not in flocks and not being chased."""
-        global animals_in_flocks, animals_being_chased
-        free_animals = animals - animals_in_flocks
-        return {a for a in free_animals if a not in animals_being_chased}
+        return animals - _unavailable_animals
 
     def _try_chase_nearby_animal(self) -> Move | None:
         """Try to chase the closest unclaimed animal in sight."""
@@ -192,6 +219,7 @@ class Player6(Player):
         # Only claim if this helper is closest to the animal
         if self._is_closest_helper_to(tx, ty, candidates[0][3]):
             animals_being_chased[target_animal] = self.id
+            _unavailable_animals.add(target_animal)
             print(f"[Helper {self.id}] Chasing free animal at ({tx}, {ty})")
             return Move(*self.move_towards(tx, ty))
 
@@ -260,24 +288,31 @@ class Player6(Player):
         if cur_x > self._patrol_x_max:
             return (float(self._patrol_x_max), float(cur_y))
 
-        # Calculate row target
-        row_y = int(max(0, min(GRID_HEIGHT - 1, self._patrol_row)))
-        end_x = self._patrol_x_max if self._patrol_dir else self._patrol_x_min
+        target = self._cached_patrol_target
+        if target is None:
+            target = self._compute_row_target()
 
         # Check if at end of current row - advance to next
-        if cur_x == end_x and cur_y == row_y:
+        if cur_x == target[0] and cur_y == target[1]:
             self._advance_to_next_patrol_row()
             # Recalculate after potential reassignment
             if not self._patrol_active:
                 return None
-            row_y = int(max(0, min(GRID_HEIGHT - 1, self._patrol_row)))
-            end_x = self._patrol_x_max if self._patrol_dir else self._patrol_x_min
+            target = self._compute_row_target()
+
+        return target
 
-        return (float(end_x), float(row_y))
+    def _compute_row_target(self) -> tuple[float, float]:
+        """Compute and cache the end point of the current patrol row."""
+        row_y = int(max(0, min(GRID_HEIGHT - 1, self._patrol_row)))
+        end_x = self._patrol_x_max if self._patrol_dir else self._patrol_x_min
+        self._cached_patrol_target = (float(end_x), float(row_y))
+        return self._cached_patrol_target
 
     def _advance_to_next_patrol_row(self) -> None:
         """Advance patrol to next row, or reassign to new strip if finished."""
         next_row = self._patrol_row + self._patrol_row_step
+        self._cached_patrol_target = None
 
         if next_row >= GRID_HEIGHT:
             self._finish_current_strip()
@@ -316,3 +351,4 @@ class Player6(Player):
         self._patrol_row = 0
         self._patrol_dir = strip_index % 2 == 0
         self._patrol_active = True
+        self._cached_patrol_target = None
@@ -13,6 +13,20 @@ ARK_BIT = 0b00000010  # bit 1, message originated from ark
 GENDER_BIT = 0b00000100  # bit 2
 SPECIES_BITS = 0b11111000  # bits 3-7 for species ID
 
+# random moves are retried this many times before falling back to fixed steps
+RANDOM_MOVE_ATTEMPTS = 4
+# the 8 cardinal/diagonal steps, same magnitude as a random move
+FALLBACK_MOVE_OFFSETS = (
+    (0.5, 0.0),
+    (-0.5, 0.0),
+    (0.0, 0.5),
+    (0.0, -0.5),
+    (0.5, 0.5),
+    (0.5, -0.5),
+    (-0.5, 0.5),
+    (-0.5, -0.5),
+)
+
 
 def encode_message(species_id: int, gender: int, from_ark: bool) -> int:
     msg = (species_id << 3) | (gender << 2)
@@ -31,8 +45,20 @@ def decode_message(msg_int: int):
     return species_id, gender, from_ark, from_local
 
 
-def distance(x1: float, y1: float, x2: float, y2: float) -> float:
-    return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+# Every message fits in one byte, so both directions are precomputed once.
+# ENCODED_MESSAGES[species_id & 0x1F][gender][from_ark]
+ENCODED_MESSAGES = tuple(
+    tuple(
+        (
+            encode_message(species_id, gender, False),
+            encode_message(species_id, gender, True),
+        )
+        for gender in (0, 1)
+    )
+    for species_id in range((SPECIES_BITS >> 3) + 1)
+)
+# DECODED_MESSAGES[msg_int] -> (species_id, gender, from_ark, from_local)
+DECODED_MESSAGES = tuple(decode_message(msg_int) for msg_int in range(1 << 8))
 
 
 class Player7(Player):
@@ -58,12 +84,17 @@ class Player7(Player):
 
     def _get_random_move(self) -> tuple[float, float]:
         old_x, old_y = self.position
-        dx, dy = random() - 0.5, random() - 0.5
 
-        while not (self.can_move_to(old_x + dx, old_y + dy)):
+        for _ in range(RANDOM_MOVE_ATTEMPTS):
             dx, dy = random() - 0.5, random() - 0.5
+            if self.can_move_to(old_x + dx, old_y + dy):
+                return old_x + dx, old_y + dy
+
+        for dx, dy in FALLBACK_MOVE_OFFSETS:
+            if self.can_move_to(old_x + dx, old_y + dy):
+                return old_x + dx, old_y + dy
 
-        return old_x + dx, old_y + dy
+        return old_x, old_y
 
     def _get_my_cell(self) -> CellView:
         xcell, ycell = tuple(map(int, self.position))
@@ -72,19 +103,24 @@ class Player7(Player):
         return self.sight.get_cellview_at(xcell, ycell)
 
     def _find_closest_priority_animal(self):
+        px, py = self.position
+        priorities = self.priorities
         closest_animal_pos = None
-        closest_dist = float("inf")
+        closest_dist2 = float("inf")
         for cellview in self.sight:
-            priority_animals = [
-                a
-                for a in cellview.animals
-                if (a.species_id, a.gender.value) in self.priorities
-            ]
-            if priority_animals:
-                dist = distance(*self.position, cellview.x, cellview.y)
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest_animal_pos = (cellview.x, cellview.y)
+            if not cellview.animals:
+                continue
+            # squared distance is enough to rank cells, and lets us skip
+            # scanning animals in cells that can't beat the current best
+            dx, dy = cellview.x - px, cellview.y - py
+            dist2 = dx * dx + dy * dy
+            if dist2 >= closest_dist2:
+                continue
+            if any(
+                (a.species_id, a.gender.value) in priorities for a in cellview.animals
+            ):
+                closest_dist2 = dist2
+                closest_animal_pos = (cellview.x, cellview.y)
         return closest_animal_pos
 
     def check_surroundings(self, snapshot: HelperSurroundingsSnapshot) -> int:
@@ -120,7 +156,7 @@ class Player7(Player):
                 if (species_id, gender) in self.priorities:
                     self.priorities.remove((species_id, gender))
                     # ark-originated message triggers release
-                    remove_msg = encode_message(species_id, gender, from_ark=True)
+                    remove_msg = ENCODED_MESSAGES[species_id & 0x1F][gender][True]
                     if remove_msg not in self.messages_sent:
                         heapq.heappush(self.messages_to_send, remove_msg)
                         self.messages_sent.add(remove_msg)
@@ -137,7 +173,7 @@ class Player7(Player):
     def get_action(self, messages: list[Message]) -> Action | None:
         # process incoming messages
         for msg in messages:
-            species_id, gender, from_ark, from_local = decode_message(msg.contents)
+            species_id, gender, from_ark, from_local = DECODED_MESSAGES[msg.contents]
             key = (species_id, gender)
 
             if from_ark:
@@ -187,9 +223,9 @@ class Player7(Player):
             chosen = choice(priority_animals)
             self.priorities.remove((chosen.species_id, chosen.gender.value))
             # broadcast helper-to-helper message (LOCAL_BIT)
-            remove_msg = encode_message(
-                chosen.species_id, chosen.gender.value, from_ark=False
-            )
+            remove_msg = ENCODED_MESSAGES[chosen.species_id & 0x1F][
+                chosen.gender.value
+            ][False]
             heapq.heappush(self.messages_to_send, remove_msg)
             return Obtain(chosen)
 
@@ -82,7 +82,7 @@ class Player7(Player):
         # Communication system from comms_player
         self.priorities: set[tuple[int, int]] = set()
         self.messages_sent: set[int] = set()
-        self.messages_to_send: list[int] = []
+        self.messages_to_send: deque[int] = deque()
         self.last_seen_ark_animals: set[tuple[int, int]] = set()
 
         # Waiting position near ark for when multiple helpers return
@@ -102,8 +102,6 @@ class Player7(Player):
 
         # Process ark view for communication
         if snapshot.ark_view:
-            import heapq
-
             current_ark = {
                 (a.species_id, a.gender.value) for a in snapshot.ark_view.animals
             }
@@ -114,16 +112,14 @@ class Player7(Player):
                 # Ark message: bits 3-7=species, bit 2=gender, bit 1=ARK
                 msg = (sid << 3) | (gender << 2) | 0b00000010
                 if msg not in self.messages_sent:
-                    heapq.heappush(self.messages_to_send, msg)
+                    self.messages_to_send.append(msg)
                     self.messages_sent.add(msg)
 
             self.last_seen_ark_animals = current_ark
 
         # Send queued message or default
         if self.messages_to_send:
-            import heapq
-
-            return heapq.heappop(self.messages_to_send)
+            return self.messages_to_send.popleft()
 
         return self._encode_message()
 
@@ -219,12 +215,10 @@ class Player7(Player):
             else:
                 self._intend_obtain = True
                 # Broadcast that we're obtaining this animal
-                import heapq
-
                 self.priorities.discard((a.species_id, a.gender.value))
                 msg = (a.species_id << 3) | (a.gender.value << 2) | 0b00000001
                 if msg not in self.messages_sent:
-                    heapq.heappush(self.messages_to_send, msg)
+                    self.messages_to_send.append(msg)
                     self.messages_sent.add(msg)
                 return Obtain(a)
 
@@ -320,7 +314,6 @@ class Player7(Player):
 
     def _process_messages(self, messages: list[Message]) -> None:
         from core.animal import Gender
-        import heapq
 
         # Expire old claims/sightings
         to_rm = [k for k, v in self._claimed.items() if v < self.turn - 20]
@@ -362,7 +355,7 @@ class Player7(Player):
                 if b not in self.messages_sent and any(
                     n != m.from_helper.id for n in neighbor_ids
                 ):
-                    heapq.heappush(self.messages_to_send, b)
+                    self.messages_to_send.append(b)
                     self.messages_sent.add(b)
 
             # Legacy protocol support
@@ -1,12 +1,125 @@
 import math
 from collections import deque
+from typing import NamedTuple
+
 from core.action import Action, Move, Obtain, Release
+from core.animal import Animal, Gender
 from core.message import Message
 from core.player import Player
 from core.snapshots import HelperSurroundingsSnapshot
+from core.views.cell_view import CellView
 from core.views.player_view import Kind
 import core.constants as c
 
+_MALE = Gender.Male
+_FEMALE = Gender.Female
+_UNK = Gender.Unknown
+
+# Integer codes used to index the value tables; None means "gender unknown"
+_GENDER_CODE = {_MALE: 0, _FEMALE: 1, _UNK: 2, None: 2}
+
+# Value multiplier by [gender_code][ark_state], where the ark state packs
+# has_male | (has_female << 1) for the species
+_VALUE_MULTIPLIER = (
+    (80, 10, 100, 10),  # male: completes when only a female is on the ark
+    (80, 100, 10, 10),  # female: completes when only a male is on the ark
+    (50, 50, 50, 50),  # unknown: assume average value
+)
+# Number of recently visited cells remembered for oscillation damping
+RECENT_CELLS_LEN = 8
+# Known animals not seen for this many turns are ignored as targets
+KNOWN_ANIMAL_STALE_TURNS = 50
+# Stale known-animal rows are compacted away every this many turns
+KNOWN_ANIMAL_COMPACT_TURNS = 64
+# Known animals are bucketed on a grid of this cell size (km)
+KNOWN_ANIMAL_BUCKET_KM = c.MAX_SIGHT_KM
+# Non-stale known animals were in sight at most STALE_TURNS moves ago,
+# so none can be farther away than this many buckets
+KNOWN_ANIMAL_MAX_RING = (
+    math.ceil(
+        (c.MAX_SIGHT_KM + KNOWN_ANIMAL_STALE_TURNS * c.MAX_DISTANCE_KM)
+        / KNOWN_ANIMAL_BUCKET_KM
+    )
+    + 1
+)
+
+# Whether an animal completes its species, by [gender_code][ark_state]
+_COMPLETES_SPECIES = (
+    (False, False, True, False),
+    (False, True, False, False),
+    (False, False, False, False),
+)
+
+# (best_value, best_completer_value, total_value) for a cell without animals
+_EMPTY_CELL_STATS = (0.0, -1.0, 0.0)
+
+
+class _FlockStats(NamedTuple):
+    """Lowest/highest value animals in the flock, from a single scan."""
+
+    min_animal: Animal | None
+    min_val: float
+    max_animal: Animal | None
+    max_val: float
+    high_value_count: int
+
+
+def _score_cells(
+    cell_xs: list[int],
+    cell_ys: list[int],
+    cell_vals: list[float],
+    px: float,
+    py: float,
+    curr: tuple[int, int],
+    blocked: dict[tuple[int, int], int],
+    recent: dict[tuple[int, int], int],
+) -> tuple[int, float]:
+    """Pick the best cell to pursue by value / distance.
+
+    Skips the current cell and blocked cells; recently visited
+    cells must beat the best so far by 1.3x. Scores are compared squared
+    (values are positive, so the ranking is the same).
+    Returns (index of the best cell or -1, best squared score).
+    """
+    best_idx = -1
+    best_score2 = -1.0
+
+    for i, (tx, ty, cell_value) in enumerate(zip(cell_xs, cell_ys, cell_vals)):
+        # Skip current cell; handled by obtain logic
+        if (tx, ty) == curr:
+            continue
+        # Skip temporarily blocked cells
+        if (tx, ty) in blocked:
+            continue
+
+        dx, dy = tx - px, ty - py
+        score2 = cell_value * cell_value / max(1.0, dx * dx + dy * dy)
+
+        # Avoid revisiting very recent cells unless much better (1.3x,
+        # i.e. 1.69x squared)
+        if (tx, ty) in recent and best_score2 >= 0:
+            if score2 <= best_score2 * 1.69:
+                continue
+
+        if score2 > best_score2:
+            best_score2 = score2
+            best_idx = i
+
+    return best_idx, best_score2
+
+
+def _ring_buckets(bx: int, by: int, ring: int):
+    """Yield the grid buckets at Chebyshev distance `ring` from (bx, by)."""
+    if ring == 0:
+        yield (bx, by)
+        return
+    for x in range(bx - ring, bx + ring + 1):
+        yield (x, by - ring)
+        yield (x, by + ring)
+    for y in range(by - ring + 1, by + ring):
+        yield (bx - ring, y)
+        yield (bx + ring, y)
+
 
 class Player7(Player):
     def __init__(
@@ -19,18 +132,74 @@ class Player7(Player):
         species_populations: dict[str, int],
     ):
         super().__init__(id, ark_x, ark_y, kind, num_helpers, species_populations)
+        self._ark_x, self._ark_y = self.ark_position
         self.my_territory = self.calculate_territory()
+        # Territory invariants used every exploration turn
+        t = self.my_territory
+        self._t_min_x, self._t_max_x = t["min_x"], t["max_x"]
+        self._t_min_y, self._t_max_y = t["min_y"], t["max_y"]
+        self._t_cx, self._t_cy = t["center_x"], t["center_y"]
+        self._t_width = max(1, self._t_max_x - self._t_min_x)
+        self._t_height = max(1, self._t_max_y - self._t_min_y)
+        # Row step ~ sight diameter so we scan with overlap
+        self._t_row_step = max(1, c.MAX_SIGHT_KM * 2 - 1)
+        self._t_row_count = max(1, self._t_height // self._t_row_step)
+        self._t_period = self._t_width + 1
         self.priorities = self.calculate_species_priorities()
+        num_species = max(self.priorities, default=-1) + 1
+        # _value_table[species_id][gender_code][ark_state] -> animal value
+        self._value_table = [
+            [
+                [self.priorities.get(species_id, 1.0) * m for m in multipliers]
+                for multipliers in _VALUE_MULTIPLIER
+            ]
+            for species_id in range(num_species)
+        ]
+        self._max_value = max(
+            (v for table in self._value_table for row in table for v in row),
+            default=0.0,
+        )
+        # Message bits 0-4 and 7 (species, high priority) per species
+        self._message_base = [
+            (species_id & 0x1F)
+            | ((1 << 7) if self.priorities.get(species_id, 0) > 1.5 else 0)
+            for species_id in range(num_species)
+        ]
+        # Ark contents per species, packed as has_male | (has_female << 1)
+        self._ark_state = [0] * num_species
         self.phase = "explore"
         self.turn_count = 0
         self.is_raining = False
-        self.known_animals = {}  # Track animals seen by self and others
-        # Track ark contents by species and gender
-        self.ark_status = {}
+        # Animals seen by self and others, stored as parallel columns
+        # (one row per (x, y, species_id)) so target scoring avoids
+        # per-entry dict indirection
+        self._ka_index: dict[tuple[int, int, int], int] = {}
+        self._ka_x: list[int] = []
+        self._ka_y: list[int] = []
+        self._ka_species: list[int] = []
+        self._ka_gcode: list[int] = []
+        self._ka_turn_seen: list[int] = []
+        # Spatial hash over known-animal rows, bucket -> row indices
+        self._ka_grid: dict[tuple[int, int], list[int]] = {}
+        # Per-turn index of the current sight, built in one pass by update_state
+        self._current_cell_view: CellView | None = None
+        # (x, y) -> (best_value, best_completer_value, total_value), only for
+        # cells with animals, in sight iteration order
+        self._cell_stats: dict[tuple[int, int], tuple[float, float, float]] = {}
+        # Columns of the cells with a positive total value, for cell scoring
+        self._cell_xs: list[int] = []
+        self._cell_ys: list[int] = []
+        self._cell_sumval: list[float] = []
+        # (x, y, best_completer_value) for cells holding a completer
+        self._completer_cells: list[tuple[int, int, float]] = []
         self.last_snapshot = None  # Store last snapshot for get_action
         # Obtain retry control
         self._intend_obtain = False
+        # Blocked cell -> expiry turn; every entry still present has not
+        # expired. Expiries are queued in insertion order so the sweep in
+        # update_state only touches cells that are due.
         self._blocked_cells: dict[tuple[int, int], int] = {}
+        self._blocked_expiries: deque[tuple[int, tuple[int, int]]] = deque()
         # Rain tracking (helpers have 1008 turns after rain starts)
         self._rain_started_at: int | None = None
         # Sticky pursuit target (cell) chosen from 5km sight
@@ -39,10 +208,17 @@ class Player7(Player):
         self._pursuit_score: float = -1.0
         self._linger_until: int = 0
         # Oscillation dampers
-        self._recent_cells: deque[tuple[int, int]] = deque(maxlen=8)
+        # Ring buffer of the last RECENT_CELLS_LEN cells, with a visit count
+        # per cell so membership tests are O(1)
+        self._recent_ring: list[tuple[int, int] | None] = [None] * RECENT_CELLS_LEN
+        self._recent_pos = 0
+        self._recent_counts: dict[tuple[int, int], int] = {}
         self._pursuit_lock_until: int = 0
         self._pursuit_last_dist: float | None = None
         self._pursuit_stuck_count: int = 0
+        # Flock scan cached for the turn it was computed on
+        self._flock_stats_turn = -1
+        self._flock_stats: _FlockStats | None = None
 
     def calculate_territory(self):
         """Divide the map into territories for each helper"""
@@ -100,23 +276,24 @@ class Player7(Player):
         # Position and flock in the Engine are held on PlayerInfo;
         # snapshots provide the authoritative values each turn.
         self.position = snapshot.position
-        self._recent_cells.append((int(self.position[0]), int(self.position[1])))
+        self._remember_recent_cell((int(self.position[0]), int(self.position[1])))
         prev_size = len(self.flock)
-        # Use a copy to avoid accidental mutation across frames
-        self.flock = snapshot.flock.copy()
+        # The engine hands every snapshot its own copy of the flock
+        self.flock = snapshot.flock
 
         # Expire blocked cells
-        to_delete = [
-            cell for cell, exp in self._blocked_cells.items() if exp <= self.turn_count
-        ]
-        for cell in to_delete:
-            del self._blocked_cells[cell]
+        blocked = self._blocked_cells
+        expiries = self._blocked_expiries
+        while expiries and expiries[0][0] <= self.turn_count:
+            exp, cell = expiries.popleft()
+            # a re-blocked cell has a later expiry queued behind this one
+            if blocked.get(cell) == exp:
+                del blocked[cell]
 
         # If we intended to obtain last turn but flock size didn't grow,
         # likely tried to obtain a shepherded animal; block this cell briefly.
         if self._intend_obtain and len(self.flock) <= prev_size:
-            cx, cy = int(self.position[0]), int(self.position[1])
-            self._blocked_cells[(cx, cy)] = self.turn_count + 5
+            self._block_cell((int(self.position[0]), int(self.position[1])))
         # If we successfully obtained (flock grew), linger here to harvest
         if self._intend_obtain and len(self.flock) > prev_size:
             self._linger_until = self.turn_count + 2
@@ -126,37 +303,145 @@ class Player7(Player):
         if snapshot.ark_view:
             self.update_ark_status(snapshot.ark_view.animals)
 
-        # Update known animals in sight
+        # Drop stale known animals so the columns stay bounded by what was
+        # seen in the last STALE_TURNS turns rather than the whole run
+        if self.turn_count % KNOWN_ANIMAL_COMPACT_TURNS == 0:
+            self._compact_known_animals()
+
+        # Single pass over sight: update known animals and index the cells
+        # (current cell view and per-cell value stats) for get_action.
         # Sight is an iterable of CellView objects, each with animals
+        self._current_cell_view = None
+        self._cell_stats = {}
+        self._cell_xs = []
+        self._cell_ys = []
+        self._cell_sumval = []
+        self._completer_cells = []
         if snapshot.sight:
+            ka_index = self._ka_index
+            value_table = self._value_table
+            ark_state = self._ark_state
+            cell_stats = self._cell_stats
+            curr_x, curr_y = int(self.position[0]), int(self.position[1])
             for cell_view in snapshot.sight:
+                if cell_view.x == curr_x and cell_view.y == curr_y:
+                    self._current_cell_view = cell_view
+                if not cell_view.animals:
+                    continue
+
+                best_val = 0.0
+                best_completer_val = -1.0
+                total_val = 0.0
                 for animal in cell_view.animals:
+                    species_id = animal.species_id
+                    gender_code = _GENDER_CODE[animal.gender]
+                    state = ark_state[species_id]
+                    value = value_table[species_id][gender_code][state]
+                    total_val += value
+                    best_val = max(best_val, value)
+                    if (
+                        _COMPLETES_SPECIES[gender_code][state]
+                        and value > best_completer_val
+                    ):
+                        best_completer_val = value
+
                     # Animals are in cells at (cell_view.x, cell_view.y)
                     key = (cell_view.x, cell_view.y, animal.species_id)
-                    self.known_animals[key] = {
-                        "species_id": animal.species_id,
-                        "gender": animal.gender,
-                        "position": (cell_view.x, cell_view.y),
-                        "turn_seen": self.turn_count,
-                    }
+                    row = ka_index.get(key)
+                    if row is None:
+                        row = len(self._ka_x)
+                        ka_index[key] = row
+                        # rows are keyed by position, so they never
+                        # change bucket once inserted
+                        bucket = (
+                            cell_view.x // KNOWN_ANIMAL_BUCKET_KM,
+                            cell_view.y // KNOWN_ANIMAL_BUCKET_KM,
+                        )
+                        self._ka_grid.setdefault(bucket, []).append(row)
+                        self._ka_x.append(cell_view.x)
+                        self._ka_y.append(cell_view.y)
+                        self._ka_species.append(animal.species_id)
+                        self._ka_gcode.append(gender_code)
+                        self._ka_turn_seen.append(self.turn_count)
+                    else:
+                        self._ka_gcode[row] = gender_code
+                        self._ka_turn_seen[row] = self.turn_count
+
+                cell_stats[(cell_view.x, cell_view.y)] = (
+                    best_val,
+                    best_completer_val,
+                    total_val,
+                )
+                if best_completer_val >= 0:
+                    self._completer_cells.append(
+                        (cell_view.x, cell_view.y, best_completer_val)
+                    )
+                if total_val > 0:
+                    self._cell_xs.append(cell_view.x)
+                    self._cell_ys.append(cell_view.y)
+                    self._cell_sumval.append(total_val)
+
+    def _compact_known_animals(self) -> None:
+        """Remove stale known-animal rows, keeping the rest in order.
+
+        A dropped animal that is seen again is appended as a new row, so
+        it loses its original place in the row-order tie-break of
+        find_highest_value_target and equal-score ties can resolve
+        differently than if the row had been kept.
+        """
+        cutoff = self.turn_count - KNOWN_ANIMAL_STALE_TURNS
+        keep = [i for i, seen in enumerate(self._ka_turn_seen) if seen >= cutoff]
+        if len(keep) == len(self._ka_turn_seen):
+            return
+
+        self._ka_x = [self._ka_x[i] for i in keep]
+        self._ka_y = [self._ka_y[i] for i in keep]
+        self._ka_species = [self._ka_species[i] for i in keep]
+        self._ka_gcode = [self._ka_gcode[i] for i in keep]
+        self._ka_turn_seen = [self._ka_turn_seen[i] for i in keep]
+
+        # Row numbers changed, so rebuild the index and the spatial hash
+        self._ka_index = {}
+        self._ka_grid = {}
+        for row, (x, y, species_id) in enumerate(
+            zip(self._ka_x, self._ka_y, self._ka_species)
+        ):
+            self._ka_index[(x, y, species_id)] = row
+            bucket = (x // KNOWN_ANIMAL_BUCKET_KM, y // KNOWN_ANIMAL_BUCKET_KM)
+            self._ka_grid.setdefault(bucket, []).append(row)
+
+    def _block_cell(self, cell: tuple[int, int]) -> None:
+        """Block a cell from obtains and pursuit for the next 5 turns."""
+        expiry = self.turn_count + 5
+        self._blocked_cells[cell] = expiry
+        self._blocked_expiries.append((expiry, cell))
+
+    def _remember_recent_cell(self, cell: tuple[int, int]) -> None:
+        """Push a cell into the recent-cells ring, evicting the oldest."""
+        counts = self._recent_counts
+        evicted = self._recent_ring[self._recent_pos]
+        if evicted is not None:
+            if counts[evicted] == 1:
+                del counts[evicted]
+            else:
+                counts[evicted] -= 1
+
+        self._recent_ring[self._recent_pos] = cell
+        self._recent_pos = (self._recent_pos + 1) % RECENT_CELLS_LEN
+        counts[cell] = counts.get(cell, 0) + 1
 
     def update_ark_status(self, ark_animals):
         """Update what species/genders are already on the ark"""
-        from core.animal import Gender
-
-        self.ark_status = {}
+        ark_state = [0] * len(self._ark_state)
         for animal in ark_animals:
-            if animal.species_id not in self.ark_status:
-                self.ark_status[animal.species_id] = {
-                    Gender.Male: False,
-                    Gender.Female: False,
-                }
-            if animal.gender != Gender.Unknown:
-                self.ark_status[animal.species_id][animal.gender] = True
+            if animal.gender is _MALE:
+                ark_state[animal.species_id] |= 1
+            elif animal.gender is _FEMALE:
+                ark_state[animal.species_id] |= 2
+        self._ark_state[:] = ark_state
 
     def encode_message(self) -> int:
         """Encode important information into 1 byte (8 bits)"""
-        from core.animal import Gender
         # Simple encoding scheme:
         # Bits 0-4: Species ID (up to 32 species)
         # Bit 5: Gender (0=Male, 1=Female)
@@ -167,19 +452,12 @@ class Player7(Player):
             return 0  # No important message
 
         # Encode the highest priority animal in our flock
-        highest_priority_animal = max(
-            self.flock, key=lambda a: self.get_animal_value(a.species_id, a.gender)
-        )
-
-        species_id = highest_priority_animal.species_id
+        highest_priority_animal = self._scan_flock().max_animal
 
-        message = species_id & 0x1F  # 5 bits for species
-        if highest_priority_animal.gender == Gender.Female:
+        message = self._message_base[highest_priority_animal.species_id]
+        if highest_priority_animal.gender is _FEMALE:
             message |= 1 << 5
-        message |= 1 << 6  # We have the animal
-        message |= (1 << 7) if self.priorities.get(species_id, 0) > 1.5 else 0
-
-        return message
+        return message | (1 << 6)  # We have the animal
 
     def get_action(self, messages: list[Message]) -> Action | None:
         """Decide the next action based on current state"""
@@ -194,13 +472,13 @@ class Player7(Player):
             self.phase = "return"
             if self.at_ark():
                 return None  # We're already at the ark
-            return self.move_towards_ark()
+            return self._move(self._ark_x, self._ark_y)
 
         # Phase 2: Return to ark if flock is full or should offload
         if len(self.flock) >= 4 or (len(self.flock) > 0 and self.should_offload()):
             if self.at_ark():
                 return None  # Unload happens automatically
-            return self.move_towards_ark()
+            return self._move(self._ark_x, self._ark_y)
 
         # Phase 3a: Try to obtain animals in current cell first, and linger
         # a couple turns after success to keep harvesting.
@@ -221,7 +499,7 @@ class Player7(Player):
                     to_release = self._choose_lowest_value_in_flock()
                     if to_release is not None:
                         return Release(to_release)
-                return self.move_towards_position(comp_pos)
+                return self._move(*comp_pos)
 
         # Phase 3c: Try to obtain animals in current cell
         target = self.find_best_animal_in_cell(self.last_snapshot)
@@ -238,9 +516,9 @@ class Player7(Player):
                 return Obtain(target)
 
         # Phase 4: Move toward highest value target animal
-        target_animal = self.find_highest_value_target()
-        if target_animal:
-            return self.move_towards_position(target_animal["position"])
+        target_pos = self.find_highest_value_target()
+        if target_pos is not None:
+            return self._move(*target_pos)
 
         # Phase 4b: Pursue best cell in 5km sight (sticky for a few turns)
         move = self._pursue_best_cell()
@@ -267,9 +545,11 @@ class Player7(Player):
             return eta * 1.2 >= time_left
 
         # Fallback: very conservative late-game return
-        distance = self.distance_to_ark()
-        if self.turn_count > 1000 and distance > 200:
-            return True
+        if self.turn_count > 1000:
+            dx = self._ark_x - self.position[0]
+            dy = self._ark_y - self.position[1]
+            if dx * dx + dy * dy > 200 * 200:
+                return True
 
         return False
 
@@ -280,12 +560,7 @@ class Player7(Player):
 
         # If we have high-value animals and flock is 75% full
         if len(self.flock) >= 3:
-            high_value_count = sum(
-                1
-                for animal in self.flock
-                if self.get_animal_value(animal.species_id, animal.gender) >= 90
-            )
-            return high_value_count >= 2
+            return self._scan_flock().high_value_count >= 2
 
         return False
 
@@ -299,19 +574,14 @@ class Player7(Player):
         current_y = int(snapshot.position[1])
 
         # If this cell is blocked (recent failed obtains), skip obtaining here
-        expiry = self._blocked_cells.get((current_x, current_y))
-        if expiry is not None and expiry > self.turn_count:
+        if (current_x, current_y) in self._blocked_cells:
             return None
 
         # Find animals at our current cell
-        animals_at_position = []
-        for cell_view in snapshot.sight:
-            if cell_view.x == current_x and cell_view.y == current_y:
-                animals_at_position = list(cell_view.animals)
-                break
-
-        if not animals_at_position:
+        cell_view = self._current_cell_view
+        if cell_view is None or not cell_view.animals:
             return None
+        animals_at_position = cell_view.animals
 
         # Find the best animal in cell; prefer completers
         best_animal = None
@@ -319,14 +589,21 @@ class Player7(Player):
         best_completer = None
         best_completer_value = -1
 
+        # flock is a set of identity-hashed animals, so this stays O(1)
+        flock = self.flock
+        value_table = self._value_table
+        ark_state = self._ark_state
         for animal in animals_at_position:
             # Skip if we already have this animal in our flock
-            if animal in self.flock:
+            if animal in flock:
                 continue
 
-            value = self.get_animal_value(animal.species_id, animal.gender)
+            species_id = animal.species_id
+            gender_code = _GENDER_CODE[animal.gender]
+            state = ark_state[species_id]
+            value = value_table[species_id][gender_code][state]
             # Check if animal would complete a species on the ark
-            if self._would_complete_species(animal.species_id, animal.gender):
+            if _COMPLETES_SPECIES[gender_code][state]:
                 if value > best_completer_value:
                     best_completer_value = value
                     best_completer = animal
@@ -337,16 +614,7 @@ class Player7(Player):
         return best_completer or best_animal
 
     def _would_complete_species(self, species_id: int, gender) -> bool:
-        from core.animal import Gender
-
-        info = self.ark_status.get(
-            species_id, {Gender.Male: False, Gender.Female: False}
-        )
-        if gender == Gender.Male:
-            return info[Gender.Female] and not info[Gender.Male]
-        if gender == Gender.Female:
-            return info[Gender.Male] and not info[Gender.Female]
-        return False
+        return _COMPLETES_SPECIES[_GENDER_CODE[gender]][self._ark_state[species_id]]
 
     def _choose_release_for_target(self, target) -> object | None:
         """If target is high-value (esp. completer) and flock full,
@@ -358,13 +626,8 @@ class Player7(Player):
             return None
 
         # Find lowest-value animal in our flock
-        lowest = None
-        lowest_val = float("inf")
-        for a in self.flock:
-            val = self.get_animal_value(a.species_id, a.gender)
-            if val < lowest_val:
-                lowest_val = val
-                lowest = a
+        stats = self._scan_flock()
+        lowest, lowest_val = stats.min_animal, stats.min_val
 
         target_val = self.get_animal_value(target.species_id, target.gender)
         if lowest is not None and target_val > lowest_val:
@@ -373,14 +636,38 @@ class Player7(Player):
 
     def _choose_lowest_value_in_flock(self):
         """Return lowest value animal in flock (or None if flock empty)."""
+        return self._scan_flock().min_animal
+
+    def _scan_flock(self) -> _FlockStats:
+        """Scan the flock once per turn for its lowest/highest value animals.
+
+        Flock and ark status only change in update_state, so the result is
+        valid for the rest of the turn.
+        """
+        if self._flock_stats is not None and self._flock_stats_turn == self.turn_count:
+            return self._flock_stats
+
         lowest = None
         lowest_val = float("inf")
+        highest = None
+        highest_val = float("-inf")
+        high_value_count = 0
         for a in self.flock:
             val = self.get_animal_value(a.species_id, a.gender)
             if val < lowest_val:
                 lowest_val = val
                 lowest = a
-        return lowest
+            if val > highest_val:
+                highest_val = val
+                highest = a
+            if val >= 90:
+                high_value_count += 1
+
+        self._flock_stats = _FlockStats(
+            lowest, lowest_val, highest, highest_val, high_value_count
+        )
+        self._flock_stats_turn = self.turn_count
+        return self._flock_stats
 
     def _find_visible_completer_outside_cell_info(
         self,
@@ -396,35 +683,26 @@ class Player7(Player):
         curr_x, curr_y = int(self.position[0]), int(self.position[1])
         best_pos = None
         best_val = -1.0
-        best_dist = float("inf")
-        for cell_view in snap.sight:
-            if (cell_view.x, cell_view.y) == (curr_x, curr_y):
+        best_dist2 = float("inf")
+        for tx, ty, cell_best_val in self._completer_cells:
+            if tx == curr_x and ty == curr_y:
                 continue
             # Skip blocked cells
-            expiry = self._blocked_cells.get((cell_view.x, cell_view.y))
-            if expiry is not None and expiry > self.turn_count:
+            if (tx, ty) in self._blocked_cells:
                 continue
 
-            cell_best_val = -1.0
-            for a in cell_view.animals:
-                if self._would_complete_species(a.species_id, a.gender):
-                    v = self.get_animal_value(a.species_id, a.gender)
-                    if v > cell_best_val:
-                        cell_best_val = v
-            if cell_best_val < 0:
-                continue
-
-            dx = cell_view.x - self.position[0]
-            dy = cell_view.y - self.position[1]
-            dist = math.hypot(dx, dy)
-            if dist < best_dist or (dist == best_dist and cell_best_val > best_val):
-                best_dist = dist
-                best_pos = (cell_view.x, cell_view.y)
+            dx = tx - self.position[0]
+            dy = ty - self.position[1]
+            # squared distance ranks cells the same way as distance
+            dist2 = dx * dx + dy * dy
+            if dist2 < best_dist2 or (dist2 == best_dist2 and cell_best_val > best_val):
+                best_dist2 = dist2
+                best_pos = (tx, ty)
                 best_val = cell_best_val
 
         if best_pos is None:
             return None
-        return (best_pos, best_val, best_dist)
+        return (best_pos, best_val, math.sqrt(best_dist2))
 
     def _best_value_in_current_cell(
         self, snapshot: HelperSurroundingsSnapshot | None
@@ -432,57 +710,79 @@ class Player7(Player):
         if not snapshot or not snapshot.sight:
             return 0.0
         cx, cy = int(self.position[0]), int(self.position[1])
-        best = 0.0
-        for cell_view in snapshot.sight:
-            if (cell_view.x, cell_view.y) != (cx, cy):
-                continue
-            for a in cell_view.animals:
-                best = max(best, self.get_animal_value(a.species_id, a.gender))
-            break
-        return best
+        return self._cell_stats.get((cx, cy), _EMPTY_CELL_STATS)[0]
 
-    def find_highest_value_target(self):
+    def find_highest_value_target(self) -> tuple[int, int] | None:
         """Find a good target not in our current or blocked cell.
 
-        Score target by value and proximity to encourage movement.
+        Score target by value and proximity to encourage movement; scores
+        are compared squared (value^2 / dist^2) to avoid a sqrt per row.
+        Buckets are visited in rings around us and the search stops once no
+        farther ring can beat the best score. Ties go to the earliest row.
+        Returns the target cell position, or None.
         """
-        from math import hypot
-
-        best_target = None
-        best_score = -1.0
-
-        curr_x = int(self.position[0])
-        curr_y = int(self.position[1])
-
-        for _, animal_info in self.known_animals.items():
-            # discard stale info
-            if self.turn_count - animal_info["turn_seen"] > 50:
-                continue
-
-            tx, ty = animal_info["position"]
-
-            # skip current cell and temporarily blocked cells
-            if (tx, ty) == (curr_x, curr_y):
-                continue
-            expiry = self._blocked_cells.get((tx, ty))
-            if expiry is not None and expiry > self.turn_count:
-                continue
-
-            value = self.get_animal_value(
-                animal_info["species_id"], animal_info.get("gender")
-            )
-
-            # prefer closer high-value targets; avoid div by zero
-            dx = tx - self.position[0]
-            dy = ty - self.position[1]
-            dist = max(1.0, hypot(dx, dy))
-            score = value / dist
+        turn = self.turn_count
+        px, py = self.position
+        curr_x, curr_y = int(px), int(py)
+        blocked = self._blocked_cells
+        value_table = self._value_table
+        ark_state = self._ark_state
+        grid = self._ka_grid
+        ka_x, ka_y = self._ka_x, self._ka_y
+        ka_species, ka_gcode = self._ka_species, self._ka_gcode
+        ka_turn_seen = self._ka_turn_seen
+
+        bx = curr_x // KNOWN_ANIMAL_BUCKET_KM
+        by = curr_y // KNOWN_ANIMAL_BUCKET_KM
+
+        best_row = -1
+        best_score2 = -1.0
+        max_value2 = self._max_value * self._max_value
+
+        for ring in range(KNOWN_ANIMAL_MAX_RING + 1):
+            # every cell in this ring is more than (ring - 1) buckets away
+            min_dist = max(1.0, (ring - 1) * KNOWN_ANIMAL_BUCKET_KM)
+            if max_value2 / (min_dist * min_dist) < best_score2:
+                break
 
-            if score > best_score:
-                best_score = score
-                best_target = animal_info
+            for bucket in _ring_buckets(bx, by, ring):
+                rows = grid.get(bucket)
+                if rows is None:
+                    continue
 
-        return best_target
+                for row in rows:
+                    # discard stale info
+                    if turn - ka_turn_seen[row] > KNOWN_ANIMAL_STALE_TURNS:
+                        continue
+
+                    tx, ty = ka_x[row], ka_y[row]
+
+                    # skip current cell and temporarily blocked cells
+                    if tx == curr_x and ty == curr_y:
+                        continue
+                    if (tx, ty) in blocked:
+                        continue
+
+                    species_id = ka_species[row]
+                    value = value_table[species_id][ka_gcode[row]][
+                        ark_state[species_id]
+                    ]
+
+                    # prefer closer high-value targets; avoid div by zero
+                    dx, dy = tx - px, ty - py
+                    score2 = value * value / max(1.0, dx * dx + dy * dy)
+
+                    # ties go to the lower row; rows re-added after
+                    # compaction sort after rows that were kept
+                    if score2 > best_score2 or (
+                        score2 == best_score2 and row < best_row
+                    ):
+                        best_score2 = score2
+                        best_row = row
+
+        if best_row < 0:
+            return None
+        return (ka_x[best_row], ka_y[best_row])
 
     def _pursue_best_cell(self) -> Move | None:
         """Pick/continue a best cell within 5km by value/effort.
@@ -499,7 +799,7 @@ class Player7(Player):
         if (
             self._pursuit_target is not None
             and self._pursuit_expires_at > self.turn_count
-            and self._blocked_cells.get(self._pursuit_target, 0) <= self.turn_count
+            and self._pursuit_target not in self._blocked_cells
         ):
             # If reached the target cell, clear pursuit
             if self._pursuit_target == curr:
@@ -523,52 +823,29 @@ class Player7(Player):
 
                 # If stuck for 3 turns, block and drop this target
                 if self._pursuit_stuck_count >= 3:
-                    self._blocked_cells[self._pursuit_target] = self.turn_count + 5
+                    self._block_cell(self._pursuit_target)
                     self._pursuit_target = None
                     self._pursuit_last_dist = None
                     self._pursuit_stuck_count = 0
                 else:
-                    return self.move_towards_position(self._pursuit_target)
-
-        # Compute best cell from current sight
-        best_cell = None
-        best_score = -1.0
-
-        for cell_view in snap.sight:
-            tx, ty = cell_view.x, cell_view.y
-
-            # Skip current cell; handled by obtain logic
-            if (tx, ty) == curr:
-                continue
-            # Skip temporarily blocked cells
-            expiry = self._blocked_cells.get((tx, ty))
-            if expiry is not None and expiry > self.turn_count:
-                continue
-
-            # Sum value of animals in that cell
-            cell_value = 0.0
-            for a in cell_view.animals:
-                cell_value += self.get_animal_value(a.species_id, a.gender)
-
-            if cell_value <= 0:
-                continue
-
-            dx = tx - self.position[0]
-            dy = ty - self.position[1]
-            dist = max(1.0, math.hypot(dx, dy))
-            score = cell_value / dist
-
-            # Avoid revisiting very recent cells unless much better
-            if (tx, ty) in self._recent_cells and best_score >= 0:
-                if score <= best_score * 1.3:
-                    continue
-
-            if score > best_score:
-                best_score = score
-                best_cell = (tx, ty)
-
-        if best_cell is None:
+                    return self._move(*self._pursuit_target)
+
+        # Compute best cell from current sight, scanning only the cells
+        # that hold something of value
+        best_idx, best_score2 = _score_cells(
+            self._cell_xs,
+            self._cell_ys,
+            self._cell_sumval,
+            self.position[0],
+            self.position[1],
+            curr,
+            self._blocked_cells,
+            self._recent_counts,
+        )
+        if best_idx < 0:
             return None
+        best_cell = (self._cell_xs[best_idx], self._cell_ys[best_idx])
+        best_score = math.sqrt(best_score2)
 
         # Set sticky pursuit and apply lock/hysteresis to avoid flips
         if (
@@ -579,7 +856,7 @@ class Player7(Player):
                 or best_score < self._pursuit_score * 1.5
             )
         ):
-            return self.move_towards_position(self._pursuit_target)
+            return self._move(*self._pursuit_target)
 
         self._pursuit_target = best_cell
         self._pursuit_score = best_score
@@ -592,98 +869,55 @@ class Player7(Player):
         self._pursuit_last_dist = max(0.0, math.hypot(dx, dy))
         self._pursuit_stuck_count = 0
 
-        return self.move_towards_position(best_cell)
+        return self._move(*best_cell)
 
     def get_animal_value(self, species_id: int, gender) -> float:
-        """Calculate value of animal based on ark status and rarity"""
-        from core.animal import Gender
-
-        base_priority = self.priorities.get(species_id, 1.0)
-
-        # Check ark status
-        ark_info = self.ark_status.get(
-            species_id, {Gender.Male: False, Gender.Female: False}
-        )
-
-        if not gender or gender == Gender.Unknown:
-            # Don't know gender yet, assume average value
-            return base_priority * 50
-
-        has_male = ark_info[Gender.Male]
-        has_female = ark_info[Gender.Female]
-
-        # Maximum value: completing a species (100 points)
-        if (gender == Gender.Male and has_female and not has_male) or (
-            gender == Gender.Female and has_male and not has_female
-        ):
-            return base_priority * 100
+        """Calculate value of animal based on ark status and rarity.
 
-        # High value: first animal of species
-        if not has_male and not has_female:
-            return base_priority * 80
-
-        # Low value: duplicate gender or already complete
-        return base_priority * 10
-
-    def move_towards_ark(self) -> Move:
-        """Move toward the ark"""
-        # Use base class move_towards which handles 1km constraint
-        new_x, new_y = self.move_towards(self.ark_position[0], self.ark_position[1])
-        return Move(new_x, new_y)
+        Completers are worth 100x the species priority, the first animal of
+        a species 80x, unknown genders 50x and duplicates 10x; all of these
+        are precomputed in `_value_table`.
+        """
+        return self._value_table[species_id][_GENDER_CODE[gender]][
+            self._ark_state[species_id]
+        ]
 
-    def move_towards_position(self, target_position: tuple[float, float]) -> Move:
-        """Move toward a target position"""
+    def _move(self, x: float, y: float) -> Move:
+        """Move toward (x, y)"""
         # Use base class move_towards which handles 1km constraint
-        new_x, new_y = self.move_towards(target_position[0], target_position[1])
-        return Move(new_x, new_y)
+        return Move(*self.move_towards(x, y))
 
     def explore_territory(self) -> Move:
         """Boustrophedon (lawnmower) sweep within assigned territory."""
-        t = self.my_territory
-        min_x, max_x = t["min_x"], t["max_x"]
-        min_y, max_y = t["min_y"], t["max_y"]
-        cx, cy = t["center_x"], t["center_y"]
+        min_x, max_x = self._t_min_x, self._t_max_x
+        min_y, max_y = self._t_min_y, self._t_max_y
 
         # If we're out of our sector, head to center first
-        if (
-            self.position[0] < min_x
-            or self.position[0] > max_x
-            or self.position[1] < min_y
-            or self.position[1] > max_y
-        ):
-            return self.move_towards_position((cx, cy))
-
-        width = max(1, max_x - min_x)
-        height = max(1, max_y - min_y)
-
-        # Row step ~ sight diameter so we scan with overlap
-        row_step = max(1, c.MAX_SIGHT_KM * 2 - 1)
-        row_count = max(1, height // row_step)
+        x, y = self.position
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            return self._move(self._t_cx, self._t_cy)
 
         # Determine which row we're on based on turns
-        row = (self.turn_count // (width + 1)) % row_count
-        y_target = min_y + min(row * row_step, height - 1)
+        period = self._t_period
+        row = (self.turn_count // period) % self._t_row_count
+        y_target = min_y + min(row * self._t_row_step, self._t_height - 1)
 
         # Alternate direction each row
-        left_to_right = row % 2 == 0
-        x_progress = self.turn_count % (width + 1)
-        x_target = min_x + x_progress if left_to_right else max_x - x_progress
+        x_progress = self.turn_count % period
+        x_target = min_x + x_progress if row & 1 == 0 else max_x - x_progress
 
         # Clamp inside bounds
         x_target = min(max(x_target, min_x), max_x)
         y_target = min(max(y_target, min_y), max_y)
 
-        return self.move_towards_position((x_target, y_target))
+        return self._move(x_target, y_target)
 
     def at_ark(self) -> bool:
         """Check if we're at the ark"""
-        return (
-            abs(self.position[0] - self.ark_position[0]) < 0.5
-            and abs(self.position[1] - self.ark_position[1]) < 0.5
-        )
+        x, y = self.position
+        return abs(x - self._ark_x) < 0.5 and abs(y - self._ark_y) < 0.5
 
     def distance_to_ark(self) -> float:
         """Calculate distance to the ark"""
-        dx = self.ark_position[0] - self.position[0]
-        dy = self.ark_position[1] - self.position[1]
-        return math.sqrt(dx**2 + dy**2)
+        x, y = self.position
+        return math.hypot(self._ark_x - x, self._ark_y - y)
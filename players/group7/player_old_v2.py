@@ -4,16 +4,125 @@ See Player8 for the same strategy mapped to group 8.
 """
 
 from __future__ import annotations
+import functools
 import math
-from collections import deque
+from collections import OrderedDict, deque
+from typing import NamedTuple
 
 from core.action import Action, Move, Obtain, Release
+from core.animal import Animal, Gender
 from core.message import Message
 from core.player import Player
 from core.snapshots import HelperSurroundingsSnapshot
+from core.views.cell_view import CellView
 from core.views.player_view import Kind
 import core.constants as c
 
+# Most cells whose failed chase attempts are remembered at once
+CHASE_ATTEMPTS_CAP = 64
+# Squared one-turn travel distance, for comparisons without a sqrt
+MAX_DISTANCE_SQ = c.MAX_DISTANCE_KM * c.MAX_DISTANCE_KM
+
+
+class Territory(NamedTuple):
+    """A helper's rectangular sweep area and its center, in whole km."""
+
+    min_x: int
+    max_x: int
+    min_y: int
+    max_y: int
+    cx: int
+    cy: int
+
+
+# Rarity and territory depend only on game setup, not on helper state, so
+# they are computed once per distinct input and shared between helpers
+
+
+@functools.cache
+def _compute_rarity(
+    species_populations: tuple[tuple[str, int], ...],
+) -> tuple[float, ...]:
+    """Rarity weight per species_id (1.0 for ids without a population)."""
+    if not species_populations:
+        return ()
+    mx = max(pop for _, pop in species_populations)
+    out = [1.0] * (max(ord(letter) - ord("a") for letter, _ in species_populations) + 1)
+    for letter, pop in species_populations:
+        sid = ord(letter) - ord("a")
+        out[sid] = (mx / pop) if pop > 0 else (mx * 10.0)
+    return tuple(out)
+
+
+@functools.cache
+def _compute_territory(id: int, num_helpers: int) -> Territory:
+    n = max(1, int(math.sqrt(num_helpers)))
+    size = c.X / n
+    sx = (id % n) * size
+    sy = (id // n) * size
+    return Territory(
+        min_x=int(sx),
+        max_x=int(min(sx + size, c.X - 1)),
+        min_y=int(sy),
+        max_y=int(min(sy + size, c.Y - 1)),
+        cx=int(sx + size / 2),
+        cy=int(sy + size / 2),
+    )
+
+
+def _score_cells(
+    xs: list[int],
+    ys: list[int],
+    vals: list[float],
+    px: float,
+    py: float,
+    curr: tuple[int, int],
+    blocked: dict[tuple[int, int], int],
+    recent,
+    turn: int,
+) -> tuple[int, float]:
+    """Score sight rows by value / distance for pursuit.
+
+    Rows in the current cell, in a cell blocked past `turn`, or with no
+    value are skipped. Returns (index of the best row or -1, its score).
+    Candidates are ranked by squared score, which orders them the same way
+    since scores are positive, so only the winner needs a square root.
+    """
+    best_idx = -1
+    best_score2 = -1.0
+
+    for i, (tx, ty, animal_val) in enumerate(zip(xs, ys, vals)):
+        if (tx, ty) == curr:
+            continue
+        exp = blocked.get((tx, ty))
+        if exp is not None and exp > turn:
+            continue
+        if animal_val <= 0:
+            continue
+
+        dx, dy = tx - px, ty - py
+        d2 = max(1.0, dx * dx + dy * dy)
+        score2 = animal_val * animal_val / d2
+
+        # Penalize recent cells (0.5x)
+        if (tx, ty) in recent:
+            score2 *= 0.25
+
+        # Strong bonus for very close animals (likely obtainable, 1.5x)
+        if d2 <= 4.0:
+            score2 *= 2.25
+        # Bonus for cells we can reach in 1 turn (1.3x)
+        elif d2 <= MAX_DISTANCE_SQ:
+            score2 *= 1.69
+
+        if score2 > best_score2:
+            best_score2 = score2
+            best_idx = i
+
+    if best_idx < 0:
+        return best_idx, -1.0
+    return best_idx, math.sqrt(best_score2)
+
 
 class Player7(Player):
     def __init__(
@@ -42,8 +151,8 @@ class Player7(Player):
         }
 
         # Rarity and territory
-        self.rarity = self._compute_rarity()
-        self.territory = self._compute_territory()
+        self.rarity = _compute_rarity(tuple(species_populations.items()))
+        self.territory = _compute_territory(id, num_helpers)
 
         # Linear formation state (optional for coordinated sweeps)
         self._formation_spacing = c.MAX_SIGHT_KM * 0.8  # Stay within sight
@@ -55,16 +164,26 @@ class Player7(Player):
         self.last_snapshot: HelperSurroundingsSnapshot | None = None
 
         # Knowledge
-        self.ark_status: dict[int, dict] = {}
-        self.known: dict[tuple[int, int, int], dict] = {}
+        # Ark contents as dense per-species_id flags
+        self._ark_has_m: list[bool] = [False] * len(self.rarity)
+        self._ark_has_f: list[bool] = [False] * len(self.rarity)
+        self._ark_count = 0
+        # species_id -> gender value that would complete it on the ark, for
+        # species with exactly one gender aboard
+        self._completer_needs: dict[int, int] = {}
 
         # Behavior
         self._intend_obtain = False
         self._linger_until = 0
         self._blocked: dict[tuple[int, int], int] = {}
+        # Expiry turn -> cells whose block ends then
+        self._blocked_expirations: dict[int, list[tuple[int, int]]] = {}
         self._recent: deque[tuple[int, int]] = deque(maxlen=self.config["recent_len"])
+        # Occurrences of each cell in _recent, for O(1) membership tests
+        self._recent_counts: dict[tuple[int, int], int] = {}
         self._cell_cache: dict[tuple[int, int], tuple[float, int]] = {}
-        self._explored: set[tuple[int, int]] = set()  # Track explored
+        # Explored cells as one byte per cell, indexed by x * c.Y + y
+        self._explored = bytearray(c.X * c.Y)
 
         # Pursuit
         self._tgt_cell: tuple[int, int] | None = None
@@ -73,8 +192,9 @@ class Player7(Player):
         self._lock_until = 0
         self._last_dist: float | None = None
         self._stuck = 0
-        # Track chase attempts per cell to avoid infinite chasing
-        self._chase_attempts: dict[tuple[int, int], int] = {}
+        # Track chase attempts per cell to avoid infinite chasing; least
+        # recently failed cells are evicted past CHASE_ATTEMPTS_CAP entries
+        self._chase_attempts: OrderedDict[tuple[int, int], int] = OrderedDict()
         self._prev_flock_size = 0  # Track for failed obtain detection
 
         # Messaging: track what others are carrying and claiming
@@ -83,10 +203,34 @@ class Player7(Player):
 
         # Communication system from comms_player
         self.priorities: set[tuple[int, int]] = set()
-        self.messages_sent: set[int] = set()
-        self.messages_to_send: list[int] = []
+        # Message ids as bitmasks (bit b set <=> message b): every message is
+        # queued at most once, and the lowest pending id is sent first
+        self._sent_mask = 0
+        self._pending_mask = 0
+        # Message id -> ids of other helpers we heard broadcasting it; once
+        # two of them have sent a message we drop our own pending relay
+        self._msg_heard_from: dict[int, set[int]] = {}
         self.last_seen_ark_animals: set[tuple[int, int]] = set()
 
+        # Memoized _value results; cleared whenever an input changes
+        # (flock contents, ark contents or the set of seen carriers)
+        self._value_cache: dict[tuple[int, Gender], float] = {}
+        # (species_id, gender) of every animal in the flock, for duplicate checks
+        self._flock_key_set: frozenset[tuple[int, Gender]] = frozenset()
+        # Flock as (value, order, animal) ascending, rebuilt lazily after
+        # the flock or any value changes
+        self._flock_valued: list[tuple[float, int, Animal]] | None = None
+
+        # Animals in sight this turn, flattened into parallel columns (one
+        # row per animal, in sight order) so scoring skips the nested walk
+        self._sight_x: list[int] = []
+        self._sight_y: list[int] = []
+        self._sight_sid: list[int] = []
+        self._sight_gender: list[Gender] = []
+        self._sight_claim_key: list[tuple[int, int]] = []
+        # Cell views in sight this turn, by (x, y)
+        self._sight_by_xy: dict[tuple[int, int], CellView] = {}
+
     def check_surroundings(self, snap: HelperSurroundingsSnapshot) -> int:
         self.last_snapshot = snap
         self._update_state(snap)
@@ -100,8 +244,6 @@ class Player7(Player):
 
         # Process ark view for communication
         if snap.ark_view:
-            import heapq
-
             current_ark = {
                 (a.species_id, a.gender.value) for a in snap.ark_view.animals
             }
@@ -110,18 +252,15 @@ class Player7(Player):
             for sid, gender in new_animals:
                 self.priorities.discard((sid, gender))
                 # Ark message: bits 3-7=species, bit 2=gender, bit 1=ARK
-                msg = (sid << 3) | (gender << 2) | 0b00000010
-                if msg not in self.messages_sent:
-                    heapq.heappush(self.messages_to_send, msg)
-                    self.messages_sent.add(msg)
+                self._queue_message((sid << 3) | (gender << 2) | 0b00000010)
 
             self.last_seen_ark_animals = current_ark
 
         # Send queued message or default
-        if self.messages_to_send:
-            import heapq
-
-            return heapq.heappop(self.messages_to_send)
+        if self._pending_mask:
+            lowest = self._pending_mask & -self._pending_mask
+            self._pending_mask ^= lowest
+            return lowest.bit_length() - 1
 
         return self._encode_message()
 
@@ -138,7 +277,7 @@ class Player7(Player):
             self._tgt_cell = None
             self._stuck = 0
             t = self.territory
-            return self._move_to((t["cx"], t["cy"]))
+            return self._move_to((t.cx, t.cy))
 
         if self._should_return():
             if self.is_in_ark():
@@ -187,13 +326,10 @@ class Player7(Player):
             else:
                 self._intend_obtain = True
                 # Broadcast that we're obtaining this animal
-                import heapq
-
                 self.priorities.discard((a.species_id, a.gender.value))
-                msg = (a.species_id << 3) | (a.gender.value << 2) | 0b00000001
-                if msg not in self.messages_sent:
-                    heapq.heappush(self.messages_to_send, msg)
-                    self.messages_sent.add(msg)
+                self._queue_message(
+                    (a.species_id << 3) | (a.gender.value << 2) | 0b00000001
+                )
                 return Obtain(a)
 
         mv = self._pursue_best_cell()
@@ -226,26 +362,31 @@ class Player7(Player):
             self._rain_started_at = snap.time_elapsed
 
         self.position = snap.position
-        self._recent.append((int(self.position[0]), int(self.position[1])))
+        self._remember_recent((int(self.position[0]), int(self.position[1])))
 
         # Mark current position and all visible cells as explored
         curr_cell = (int(self.position[0]), int(self.position[1]))
-        self._explored.add(curr_cell)
+        explored = self._explored
+        explored[curr_cell[0] * c.Y + curr_cell[1]] = 1
+        sight_by_xy = {}
         for cv in snap.sight:
-            self._explored.add((cv.x, cv.y))
+            explored[cv.x * c.Y + cv.y] = 1
+            sight_by_xy[(cv.x, cv.y)] = cv
+        self._sight_by_xy = sight_by_xy
 
         prev = len(self.flock)
+        if snap.flock != self.flock:
+            self._flock_valued = None
         self.flock = snap.flock.copy()
-
-        expired = [p for p, t in self._blocked.items() if t <= self.turn]
-        for p in expired:
-            del self._blocked[p]
-
-        # Periodic cleanup: if too many blocked cells, clear old ones
-        if len(self._blocked) > 20:
-            cutoff = self.turn - 10
-            old = [p for p, t in self._blocked.items() if t < cutoff]
-            for p in old:
+        flock_keys = frozenset((a.species_id, a.gender) for a in self.flock)
+        if flock_keys != self._flock_key_set:
+            self._flock_key_set = flock_keys
+            self._invalidate_values()
+
+        # Turns advance one at a time, so only this turn's bucket can expire
+        for p in self._blocked_expirations.pop(self.turn, ()):
+            # skip cells re-blocked since with a later expiry
+            if self._blocked.get(p) == self.turn:
                 del self._blocked[p]
 
         if self._intend_obtain:
@@ -253,21 +394,48 @@ class Player7(Player):
                 self._linger_until = self.turn + self.config["linger_turns"]
             else:
                 cx, cy = int(self.position[0]), int(self.position[1])
-                self._blocked[(cx, cy)] = self.turn + self.config["block_after_fail"]
+                self._block((cx, cy), self.turn + self.config["block_after_fail"])
         self._intend_obtain = False
 
         if snap.ark_view is not None:
             self._update_ark(snap.ark_view.animals)
 
+        sight_x: list[int] = []
+        sight_y: list[int] = []
+        sight_sid: list[int] = []
+        sight_gender: list[Gender] = []
+        sight_claim_key: list[tuple[int, int]] = []
         for cv in snap.sight:
             for an in cv.animals:
-                key = (cv.x, cv.y, an.species_id)
-                self.known[key] = {
-                    "sid": an.species_id,
-                    "gender": an.gender,
-                    "pos": (cv.x, cv.y),
-                    "seen": self.turn,
-                }
+                sight_x.append(cv.x)
+                sight_y.append(cv.y)
+                sight_sid.append(an.species_id)
+                sight_gender.append(an.gender)
+                sight_claim_key.append((an.species_id, an.gender.value))
+        self._sight_x = sight_x
+        self._sight_y = sight_y
+        self._sight_sid = sight_sid
+        self._sight_gender = sight_gender
+        self._sight_claim_key = sight_claim_key
+
+    def _remember_recent(self, cell: tuple[int, int]) -> None:
+        recent, counts = self._recent, self._recent_counts
+        if len(recent) == recent.maxlen:
+            evicted = recent[0]
+            if counts[evicted] == 1:
+                del counts[evicted]
+            else:
+                counts[evicted] -= 1
+        recent.append(cell)
+        counts[cell] = counts.get(cell, 0) + 1
+
+    def _clear_recent(self) -> None:
+        self._recent.clear()
+        self._recent_counts.clear()
+
+    def _block(self, cell: tuple[int, int], until: int) -> None:
+        self._blocked[cell] = until
+        self._blocked_expirations.setdefault(until, []).append(cell)
 
     def _encode_message(self) -> int:
         if not self.flock:
@@ -276,18 +444,20 @@ class Player7(Player):
         best = max(self.flock, key=lambda a: self._value(a.species_id, a.gender))
         sid = best.species_id & 0x1F
         msg = sid
-        from core.animal import Gender
-
         if best.gender == Gender.Female:
             msg |= 1 << 5
         msg |= 1 << 6  # Have this animal
         msg |= 1 << 7  # Claiming (avoid duplicates)
         return msg
 
-    def _process_messages(self, messages: list[Message]) -> None:
-        from core.animal import Gender
-        import heapq
+    def _queue_message(self, msg: int) -> None:
+        """Queue a message for broadcast unless it was ever queued before."""
+        bit = 1 << msg
+        if not self._sent_mask & bit:
+            self._sent_mask |= bit
+            self._pending_mask |= bit
 
+    def _process_messages(self, messages: list[Message]) -> None:
         # Expire old claims/sightings
         to_rm = [k for k, v in self._claimed.items() if v < self.turn - 20]
         for k in to_rm:
@@ -295,9 +465,22 @@ class Player7(Player):
         to_rm = [k for k, v in self._seen_carrying.items() if v < self.turn - 20]
         for k in to_rm:
             del self._seen_carrying[k]
+        carrying_changed = bool(to_rm)
+
+        neighbor_ids = None
+        if self.last_snapshot:
+            neighbor_ids = {
+                h.id
+                for cv in self.last_snapshot.sight
+                for h in cv.helpers
+                if h.id != self.id
+            }
 
         for m in messages:
             b = m.contents
+            heard_from = self._msg_heard_from.setdefault(b, set())
+            if m.from_helper.id != self.id:
+                heard_from.add(m.from_helper.id)
 
             # Decode message
             from_ark = bool(b & 0b00000010)
@@ -318,18 +501,15 @@ class Player7(Player):
                 self.priorities.discard((sid, gender))
 
             # Forward message to neighbors
-            if self.last_snapshot:
-                neighbor_ids = {
-                    h.id
-                    for cv in self.last_snapshot.sight
-                    for h in cv.helpers
-                    if h.id != self.id
-                }
-                if b not in self.messages_sent and any(
-                    n != m.from_helper.id for n in neighbor_ids
-                ):
-                    heapq.heappush(self.messages_to_send, b)
-                    self.messages_sent.add(b)
+            if neighbor_ids is not None and any(
+                n != m.from_helper.id for n in neighbor_ids
+            ):
+                self._queue_message(b)
+
+            # Rumour suppression: two other helpers already broadcast this
+            # message, so our still-pending relay of it adds nothing
+            if len(heard_from) >= 2:
+                self._pending_mask &= ~(1 << b)
 
             # Legacy protocol support
             female = (b >> 5) & 1
@@ -337,10 +517,15 @@ class Player7(Player):
             claiming = (b >> 7) & 1
             g = Gender.Female if female else Gender.Male
             if have:
+                if (sid, g.value) not in self._seen_carrying:
+                    carrying_changed = True
                 self._seen_carrying[(sid, g.value)] = self.turn
             if claiming:
                 self._claimed[(sid, g.value)] = self.turn
 
+        if carrying_changed:
+            self._invalidate_values()
+
     # -------- Decision helpers --------
 
     def _should_return(self) -> bool:
@@ -373,30 +558,27 @@ class Player7(Player):
         exp = self._blocked.get((cx, cy))
         if exp is not None and exp > self.turn:
             return None
-        animals = None
-        for cv in snap.sight:
-            if cv.x == cx and cv.y == cy:
-                animals = list(cv.animals)
-                break
-        if not animals:
+        cv = self._sight_by_xy.get((cx, cy))
+        if cv is None or not cv.animals:
             return None
+
+        # Skip exact species+gender duplicates (we already carry one; this
+        # also covers animals already in the flock) and targets claimed by
+        # other helpers
+        flock_keys = self._flock_key_set
+        claimed = self._claimed
+        candidates = [
+            a
+            for a in cv.animals
+            if (a.species_id, a.gender) not in flock_keys
+            and (a.species_id, a.gender.value) not in claimed
+        ]
+
         best = None
         best_val = -1.0
         best_comp = None
         best_comp_val = -1.0
-        for a in animals:
-            if a in self.flock:
-                continue
-            # Skip exact species+gender duplicates (we already carry one)
-            if any(
-                f.species_id == a.species_id and f.gender == a.gender
-                for f in self.flock
-            ):
-                continue
-            # Skip claimed targets from other helpers
-            if (a.species_id, a.gender.value) in self._claimed:
-                continue
-
+        for a in candidates:
             # Prioritize animals in priority set
             is_priority = (a.species_id, a.gender.value) in self.priorities
             val = self._value(a.species_id, a.gender)
@@ -404,7 +586,7 @@ class Player7(Player):
             if is_priority:
                 val *= 1.5  # Boost priority animals
 
-            if self._would_complete(a.species_id, a.gender):
+            if self._completer_needs.get(a.species_id) == a.gender.value:
                 if val > best_comp_val:
                     best_comp_val = val
                     best_comp = a
@@ -419,22 +601,20 @@ class Player7(Player):
             return 0.0
         cx, cy = int(self.position[0]), int(self.position[1])
         best = 0.0
-        for cv in snap.sight:
-            if cv.x == cx and cv.y == cy:
-                for a in cv.animals:
-                    best = max(best, self._value(a.species_id, a.gender))
-                break
+        cv = self._sight_by_xy.get((cx, cy))
+        if cv is not None:
+            for a in cv.animals:
+                best = max(best, self._value(a.species_id, a.gender))
         return best
 
     def _lowest_in_flock(self):
-        worst = None
-        worst_val = float("inf")
-        for a in self.flock:
-            v = self._value(a.species_id, a.gender)
-            if v < worst_val:
-                worst_val = v
-                worst = a
-        return worst
+        if self._flock_valued is None:
+            # order breaks value ties in flock iteration order
+            self._flock_valued = sorted(
+                (self._value(a.species_id, a.gender), i, a)
+                for i, a in enumerate(self.flock)
+            )
+        return self._flock_valued[0][2] if self._flock_valued else None
 
     def _choose_release(self, target):
         if not self._would_complete(target.species_id, target.gender):
@@ -451,30 +631,36 @@ class Player7(Player):
         snap = self.last_snapshot
         if snap is None:
             return None
-        cx, cy = int(self.position[0]), int(self.position[1])
+        px, py = self.position[0], self.position[1]
+        cx, cy = int(px), int(py)
+        turn = self.turn
+        blocked = self._blocked
+        flock_keys = self._flock_key_set
+        needs = self._completer_needs
+        if not needs:
+            return None
         best_pos = None
         best_val = -1.0
-        for cv in snap.sight:
-            if (cv.x, cv.y) == (cx, cy):
+        # The first row holding the overall best value is in the first cell
+        # (in sight order) whose own best is that value
+        for tx, ty, sid, gender in zip(
+            self._sight_x, self._sight_y, self._sight_sid, self._sight_gender
+        ):
+            # Only completers matter; most animals fail this first
+            if needs.get(sid) != gender.value:
                 continue
-            exp = self._blocked.get((cv.x, cv.y))
-            if exp is not None and exp > self.turn:
+            if tx == cx and ty == cy:
                 continue
-            cell_best = -1.0
-            for a in cv.animals:
-                # Skip duplicates
-                if any(
-                    f.species_id == a.species_id and f.gender == a.gender
-                    for f in self.flock
-                ):
-                    continue
-                if self._would_complete(a.species_id, a.gender):
-                    cell_best = max(cell_best, self._value(a.species_id, a.gender))
-            if cell_best < 0:
+            exp = blocked.get((tx, ty))
+            if exp is not None and exp > turn:
+                continue
+            # Skip duplicates
+            if (sid, gender) in flock_keys:
                 continue
-            if cell_best > best_val:
-                best_val = cell_best
-                best_pos = (cv.x, cv.y)
+            val = self._value(sid, gender)
+            if val > best_val:
+                best_val = val
+                best_pos = (tx, ty)
         if best_pos is None:
             return None
         return best_pos, best_val
@@ -483,11 +669,8 @@ class Player7(Player):
         snap = self.last_snapshot
         if snap is None:
             return None
-        curr = (int(self.position[0]), int(self.position[1]))
-
-        # Clean up old chase attempts
-        if self.turn % 50 == 0:
-            self._chase_attempts.clear()
+        px, py = self.position[0], self.position[1]
+        curr = (int(px), int(py))
 
         # Check if we have an active target
         if (
@@ -501,16 +684,18 @@ class Player7(Player):
                 if self._prev_flock_size == current_flock_size:
                     # Flock didn't grow - animal likely moved away
                     cell_key = self._tgt_cell
-                    self._chase_attempts[cell_key] = (
-                        self._chase_attempts.get(cell_key, 0) + 1
-                    )
+                    attempts = self._chase_attempts
+                    attempts[cell_key] = attempts.get(cell_key, 0) + 1
+                    attempts.move_to_end(cell_key)
+                    if len(attempts) > CHASE_ATTEMPTS_CAP:
+                        attempts.popitem(last=False)
                     # After 2 failed attempts at same cell, block it
-                    if self._chase_attempts[cell_key] >= 2:
-                        self._blocked[self._tgt_cell] = self.turn + 20
+                    if attempts[cell_key] >= 2:
+                        self._block(self._tgt_cell, self.turn + 20)
                         self._tgt_cell = None
                         self._last_dist = None
                         self._stuck = 0
-                        self._recent.clear()
+                        self._clear_recent()
                         return None
                 else:
                     # Success! Clear chase attempts for this cell
@@ -523,9 +708,7 @@ class Player7(Player):
             else:
                 # Check if making progress toward target
                 tx, ty = self._tgt_cell
-                dx = tx - self.position[0]
-                dy = ty - self.position[1]
-                d = max(0.0, math.hypot(dx, dy))
+                d = max(0.0, math.hypot(tx - px, ty - py))
 
                 if self._last_dist is not None:
                     if d >= self._last_dist - 1e-6:
@@ -537,26 +720,21 @@ class Player7(Player):
 
                 if self._stuck >= self.config["stuck_threshold"]:
                     # Give up on this target
-                    self._blocked[self._tgt_cell] = (
-                        self.turn + self.config["give_up_turns"]
+                    self._block(
+                        self._tgt_cell, self.turn + self.config["give_up_turns"]
                     )
                     self._tgt_cell = None
                     self._last_dist = None
                     self._stuck = 0
-                    self._recent.clear()
+                    self._clear_recent()
                 else:
                     # Continue toward target only if still valuable
                     target_val = 0.0
-                    for cv in snap.sight:
-                        if (cv.x, cv.y) == self._tgt_cell:
-                            for a in cv.animals:
-                                if not any(
-                                    f.species_id == a.species_id
-                                    and f.gender == a.gender
-                                    for f in self.flock
-                                ):
-                                    target_val += self._value(a.species_id, a.gender)
-                            break
+                    cv = self._sight_by_xy.get(self._tgt_cell)
+                    if cv is not None:
+                        for a in cv.animals:
+                            if (a.species_id, a.gender) not in self._flock_key_set:
+                                target_val += self._value(a.species_id, a.gender)
                     # Only continue if target still has value
                     if target_val >= 5:
                         return self._move_to(self._tgt_cell)
@@ -565,56 +743,39 @@ class Player7(Player):
                         self._tgt_cell = None
                         self._stuck = 0
 
-        # Find best animal to target
-        best_cell = None
-        best_score = -1.0
-
-        for cv in snap.sight:
-            tx, ty = cv.x, cv.y
-            if (tx, ty) == curr:
-                continue
-            exp = self._blocked.get((tx, ty))
-            if exp is not None and exp > self.turn:
-                continue
-
-            # Evaluate each animal in this cell
-            for a in cv.animals:
-                if any(
-                    f.species_id == a.species_id and f.gender == a.gender
-                    for f in self.flock
-                ):
-                    continue
-                if (a.species_id, a.gender.value) in self._claimed:
-                    continue
-
-                animal_val = self._value(a.species_id, a.gender)
-                if animal_val <= 0:
-                    continue
-
-                dx = tx - self.position[0]
-                dy = ty - self.position[1]
-                dist = max(1.0, math.hypot(dx, dy))
-                score = animal_val / dist
-
-                # Penalize recent cells
-                if (tx, ty) in self._recent:
-                    score *= 0.5
-
-                # Strong bonus for very close animals (likely obtainable)
-                if dist <= 2.0:
-                    score *= 1.5
-                # Bonus for cells we can reach in 1 turn
-                elif dist <= c.MAX_DISTANCE_KM:
-                    score *= 1.3
-
-                if score > best_score:
-                    best_score = score
-                    best_cell = (tx, ty)
+        # Find best animal to target: value each animal in sight (duplicates
+        # and claimed targets are worth nothing), then score the rows
+        flock_keys = self._flock_key_set
+        claimed = self._claimed
+        vals = [
+            0.0
+            if (sid, gender) in flock_keys or claim_key in claimed
+            else self._value(sid, gender)
+            for sid, gender, claim_key in zip(
+                self._sight_sid, self._sight_gender, self._sight_claim_key
+            )
+        ]
+        best_idx, best_score = _score_cells(
+            self._sight_x,
+            self._sight_y,
+            vals,
+            px,
+            py,
+            curr,
+            self._blocked,
+            self._recent_counts,
+            self.turn,
+        )
+        best_cell = (
+            (self._sight_x[best_idx], self._sight_y[best_idx])
+            if best_idx >= 0
+            else None
+        )
 
         if best_cell is None:
             # No valuable cells, clear history
             if len(self._recent) > 5:
-                self._recent.clear()
+                self._clear_recent()
             return None
 
         # Pursue any positive value target (be more aggressive)
@@ -626,37 +787,36 @@ class Player7(Player):
         self._tgt_score = best_score
         self._tgt_expires = self.turn + 5  # Shorter expiry
         self._lock_until = self.turn + 1  # Minimal lock
-        dx = best_cell[0] - self.position[0]
-        dy = best_cell[1] - self.position[1]
-        self._last_dist = max(0.0, math.hypot(dx, dy))
+        self._last_dist = max(0.0, math.hypot(best_cell[0] - px, best_cell[1] - py))
         self._stuck = 0
         return self._move_to(best_cell)
 
     # -------- Scoring --------
 
     def _would_complete(self, sid: int, gender) -> bool:
-        from core.animal import Gender
+        return gender is not None and self._completer_needs.get(sid) == gender.value
 
-        info = self.ark_status.get(sid, {Gender.Male: False, Gender.Female: False})
-        if gender == Gender.Male:
-            return info[Gender.Female] and not info[Gender.Male]
-        if gender == Gender.Female:
-            return info[Gender.Male] and not info[Gender.Female]
-        return False
+    def _invalidate_values(self) -> None:
+        self._value_cache.clear()
+        self._flock_valued = None
 
     def _value(self, sid: int, gender) -> float:
-        from core.animal import Gender
-
-        base = self.rarity.get(sid, 1.0)
-        info = self.ark_status.get(sid, {Gender.Male: False, Gender.Female: False})
+        key = (sid, gender)
+        value = self._value_cache.get(key)
+        if value is None:
+            value = self._value_cache[key] = self._compute_value(sid, gender)
+        return value
+
+    def _compute_value(self, sid: int, gender) -> float:
+        base = self.rarity[sid]
         if gender is None or gender == Gender.Unknown:
             return base * 50
         # If we already carry this species+gender in flock, make it worthless
         # so pursuit scoring and selection ignore duplicates.
-        if any(f.species_id == sid and f.gender == gender for f in self.flock):
+        if (sid, gender) in self._flock_key_set:
             return 0.0
-        has_m = info[Gender.Male]
-        has_f = info[Gender.Female]
+        has_m = self._ark_has_m[sid]
+        has_f = self._ark_has_f[sid]
         if (gender == Gender.Male and has_f and not has_m) or (
             gender == Gender.Female and has_m and not has_f
         ):
@@ -669,17 +829,28 @@ class Player7(Player):
         return base * 10
 
     def _update_ark(self, animals) -> None:
-        from core.animal import Gender
-
-        self.ark_status = {}
+        # The ark only ever gains animals, so an unchanged count means
+        # nothing came aboard since the last view
+        if len(animals) == self._ark_count:
+            return
+        self._ark_count = len(animals)
+
+        has_m, has_f = self._ark_has_m, self._ark_has_f
+        changed = False
         for a in animals:
-            if a.species_id not in self.ark_status:
-                self.ark_status[a.species_id] = {
-                    Gender.Male: False,
-                    Gender.Female: False,
-                }
-            if a.gender != Gender.Unknown:
-                self.ark_status[a.species_id][a.gender] = True
+            sid = a.species_id
+            if a.gender == Gender.Male and not has_m[sid]:
+                has_m[sid] = changed = True
+            elif a.gender == Gender.Female and not has_f[sid]:
+                has_f[sid] = changed = True
+
+        if changed:
+            self._invalidate_values()
+            self._completer_needs = {
+                sid: Gender.Female.value if m else Gender.Male.value
+                for sid, (m, f) in enumerate(zip(has_m, has_f))
+                if m != f
+            }
 
     # -------- Movement & exploration --------
 
@@ -689,18 +860,11 @@ class Player7(Player):
 
     def _explore(self) -> Move:
         """Explore territory with formation-aware coordination."""
-        t = self.territory
-        min_x, max_x = t["min_x"], t["max_x"]
-        min_y, max_y = t["min_y"], t["max_y"]
-        cx, cy = t["cx"], t["cy"]
+        min_x, max_x, min_y, max_y, cx, cy = self.territory
 
         # If outside territory, return to center
-        if (
-            self.position[0] < min_x
-            or self.position[0] > max_x
-            or self.position[1] < min_y
-            or self.position[1] > max_y
-        ):
+        px, py = self.position[0], self.position[1]
+        if px < min_x or px > max_x or py < min_y or py > max_y:
             return self._move_to((cx, cy))
 
         # Try to maintain formation with visible helpers
@@ -722,8 +886,8 @@ class Player7(Player):
                 target_y = max(min_y, min(target_y, max_y))
 
                 # If too far from formation, move back
-                if abs(self.position[1] - target_y) > self._formation_spacing:
-                    return self._move_to((self.position[0], target_y))
+                if abs(py - target_y) > self._formation_spacing:
+                    return self._move_to((px, target_y))
 
         # Find nearest unexplored cell within territory
         unexplored = self._find_nearest_unexplored()
@@ -738,10 +902,11 @@ class Player7(Player):
 
         # Add variation to avoid clustering
         offset = (self.id * 37) % (width + 1)
-        row = ((self.turn + offset) // (width + 1)) % rows
+        turn = self.turn
+        row = ((turn + offset) // (width + 1)) % rows
         y_tgt = min_y + min(row * row_step, height - 1)
         ltr = row % 2 == 0
-        x_prog = (self.turn + offset) % (width + 1)
+        x_prog = (turn + offset) % (width + 1)
         x_tgt = min_x + x_prog if ltr else max_x - x_prog
         x_tgt = min(max(x_tgt, min_x), max_x)
         y_tgt = min(max(y_tgt, min_y), max_y)
@@ -749,55 +914,38 @@ class Player7(Player):
 
     def _find_nearest_unexplored(self) -> tuple[int, int] | None:
         """Find the nearest unexplored cell within territory."""
-        t = self.territory
-        min_x, max_x = t["min_x"], t["max_x"]
-        min_y, max_y = t["min_y"], t["max_y"]
+        min_x, max_x, min_y, max_y, _, _ = self.territory
 
         # Sample grid points in territory
         step = max(5, c.MAX_SIGHT_KM)
-        candidates = []
+        px, py = self.position[0], self.position[1]
+        explored = self._explored
+        best = None
+        best_d2 = math.inf
+        # Keep the running minimum of squared distance; points are visited
+        # in (x, y) order, so the first one found wins ties
         for x in range(min_x, max_x + 1, step):
+            dx2 = (x - px) * (x - px)
+            if dx2 >= best_d2:
+                if x > px:
+                    break  # every later column is farther still
+                continue
+            base = x * c.Y
             for y in range(min_y, max_y + 1, step):
-                if (x, y) not in self._explored:
-                    dist = math.hypot(x - self.position[0], y - self.position[1])
-                    candidates.append((dist, (x, y)))
-
-        if not candidates:
-            return None
+                d2 = dx2 + (y - py) * (y - py)
+                if d2 >= best_d2:
+                    if y > py:
+                        break
+                    continue
+                if not explored[base + y]:
+                    best_d2 = d2
+                    best = (x, y)
 
         # Return closest unexplored point
-        candidates.sort()
-        return candidates[0][1]
-
-    # -------- Setup helpers --------
-
-    def _compute_rarity(self) -> dict[int, float]:
-        if not self.species_populations:
-            return {}
-        mx = max(self.species_populations.values())
-        out: dict[int, float] = {}
-        for letter, pop in self.species_populations.items():
-            sid = ord(letter) - ord("a")
-            out[sid] = (mx / pop) if pop > 0 else (mx * 10.0)
-        return out
-
-    def _compute_territory(self) -> dict[str, int]:
-        n = max(1, int(math.sqrt(self.num_helpers)))
-        size = c.X / n
-        sx = (self.id % n) * size
-        sy = (self.id // n) * size
-        return {
-            "min_x": int(sx),
-            "max_x": int(min(sx + size, c.X - 1)),
-            "min_y": int(sy),
-            "max_y": int(min(sy + size, c.Y - 1)),
-            "cx": int(sx + size / 2),
-            "cy": int(sy + size / 2),
-        }
+        return best
 
     # -------- Utils --------
 
     def _dist_to_ark(self) -> float:
-        dx = self.ark_position[0] - self.position[0]
-        dy = self.ark_position[1] - self.position[1]
-        return math.hypot(dx, dy)
+        px, py = self.position[0], self.position[1]
+        return math.hypot(self.ark_position[0] - px, self.ark_position[1] - py)
@@ -1,15 +1,22 @@
 """Player7: Army formation sweep with communication protocol."""
 
 from __future__ import annotations
-import heapq
 
 from core.action import Action, Move, Obtain
 from core.message import Message
 from core.player import Player
 from core.snapshots import HelperSurroundingsSnapshot
+from core.views.cell_view import CellView
 from core.views.player_view import Kind
 import core.constants as c
 
+# Decoded fields (from_ark, from_local, gender, species_id) for every message
+# byte: bit 1=ARK, bit 0=LOCAL, bit 2=gender, bits 3-7=species
+MESSAGE_FIELDS = tuple(
+    (bool(b & 0b00000010), bool(b & 0b00000001), (b & 0b00000100) >> 2, b >> 3)
+    for b in range(256)
+)
+
 
 class Player7(Player):
     def __init__(
@@ -24,9 +31,11 @@ class Player7(Player):
         super().__init__(id, ark_x, ark_y, kind, num_helpers, species_populations)
 
         # Communication protocol (from comms_player)
-        self.priorities: set[tuple[int, int]] = set()
-        self.messages_sent: set[int] = set()
-        self.messages_to_send: list[int] = []
+        # Bit (2 * species_id + gender) is set while that animal is wanted
+        self.priorities_mask = 0
+        # Bit b is set once message b has been queued / is waiting to be sent
+        self.sent_mask = 0
+        self.pending_mask = 0
         self.last_seen_ark_animals: set[tuple[int, int]] = set()
 
         # Strip-based exploration
@@ -45,6 +54,7 @@ class Player7(Player):
 
         # State
         self.turn = 0
+        self.current_cell: CellView | None = None
         self.is_raining = False
 
     def check_surroundings(self, snap: HelperSurroundingsSnapshot) -> int:
@@ -52,20 +62,24 @@ class Player7(Player):
         self.position = snap.position
         self.flock = snap.flock
         self.is_raining = snap.is_raining
-        self.last_snapshot = snap  # Save for animal detection
+
+        # Save our own cell for animal detection
+        cx, cy = int(self.position[0]), int(self.position[1])
+        self.current_cell = (
+            snap.sight.get_cellview_at(cx, cy)
+            if snap.sight.cell_is_in_sight(cx, cy)
+            else None
+        )
 
         # Initialize priorities on first turn
         if self.turn == 1 and self.kind != Kind.Noah:
             for letter in self.species_populations.keys():
                 sid = ord(letter) - ord("a")
-                self.priorities.add((sid, 0))  # Male
-                self.priorities.add((sid, 1))  # Female
+                self.priorities_mask |= 0b11 << (2 * sid)  # Male and female
 
         # Noah: just forward messages
         if self.kind == Kind.Noah:
-            if self.messages_to_send:
-                return heapq.heappop(self.messages_to_send)
-            return 0
+            return self._pop_message()
 
         # Process ark view for communication
         if snap.ark_view:
@@ -75,20 +89,30 @@ class Player7(Player):
             new_animals = current_ark - self.last_seen_ark_animals
 
             for sid, gender in new_animals:
-                self.priorities.discard((sid, gender))
+                self.priorities_mask &= ~(1 << (2 * sid + gender))
                 # Ark message: bits 3-7=species, bit 2=gender, bit 1=ARK
-                msg = (sid << 3) | (gender << 2) | 0b00000010
-                if msg not in self.messages_sent:
-                    heapq.heappush(self.messages_to_send, msg)
-                    self.messages_sent.add(msg)
+                self._queue_message((sid << 3) | (gender << 2) | 0b00000010)
 
             self.last_seen_ark_animals = current_ark
 
         # Send queued message
-        if self.messages_to_send:
-            return heapq.heappop(self.messages_to_send)
-
-        return 0
+        return self._pop_message()
+
+    def _queue_message(self, msg: int) -> None:
+        """Queue a message for sending unless it was already queued before."""
+        bit = 1 << msg
+        if not self.sent_mask & bit:
+            self.sent_mask |= bit
+            self.pending_mask |= bit
+
+    def _pop_message(self) -> int:
+        """Pop the smallest pending message, or 0 if none is pending."""
+        pending = self.pending_mask
+        if not pending:
+            return 0
+        lowest = pending & -pending
+        self.pending_mask = pending ^ lowest
+        return lowest.bit_length() - 1
 
     def get_action(self, messages: list[Message]) -> Action | None:
         if self.kind == Kind.Noah:
@@ -104,81 +128,62 @@ class Player7(Player):
             return None
 
         # Try to obtain priority animals at current location
-        if hasattr(self, "last_snapshot") and self.last_snapshot:
-            cx, cy = int(self.position[0]), int(self.position[1])
-            for cv in self.last_snapshot.sight:
-                if cv.x == cx and cv.y == cy:
-                    # Found our cell, check for priority animals
-                    for animal in cv.animals:
-                        key = (animal.species_id, animal.gender.value)
-                        if key in self.priorities and len(self.flock) < 4:
-                            self.priorities.discard(key)
-                            # Broadcast obtain message
-                            msg = (
-                                (animal.species_id << 3)
-                                | (animal.gender.value << 2)
-                                | 0b00000001
-                            )
-                            if msg not in self.messages_sent:
-                                heapq.heappush(self.messages_to_send, msg)
-                                self.messages_sent.add(msg)
-                            return Obtain(animal)
-                    break
+        cv = self.current_cell
+        if cv is not None:
+            for animal in cv.animals:
+                bit = 1 << (2 * animal.species_id + animal.gender.value)
+                if self.priorities_mask & bit and len(self.flock) < 4:
+                    self.priorities_mask &= ~bit
+                    # Broadcast obtain message
+                    self._queue_message(
+                        (animal.species_id << 3)
+                        | (animal.gender.value << 2)
+                        | 0b00000001
+                    )
+                    return Obtain(animal)
 
         # Move in army formation
         return self._formation_move()
 
     def _process_messages(self, messages: list[Message]) -> None:
         """Process incoming messages and forward to neighbors."""
+        fields = MESSAGE_FIELDS
+        queue_message = self._queue_message
+        priorities_mask = self.priorities_mask
         for msg in messages:
             b = msg.contents
 
-            # Decode: bit 1=ARK, bit 0=LOCAL, bit 2=gender, bits 3-7=species
-            from_ark = bool(b & 0b00000010)
-            from_local = bool(b & 0b00000001)
-            gender = (b & 0b00000100) >> 2
-            sid = (b & 0b11111000) >> 3
+            from_ark, from_local, gender, sid = fields[b]
 
-            key = (sid, gender)
-
-            # Handle ark messages (release if we have it)
-            if from_ark:
-                for a in self.flock:
-                    if a.species_id == sid and a.gender.value == gender:
-                        self.priorities.discard(key)
-                        break
-
-            # Handle local messages (update priorities)
+            # Handle ark and local messages (update priorities)
             if from_local or from_ark:
-                self.priorities.discard(key)
+                priorities_mask &= ~(1 << (2 * sid + gender))
 
             # Forward message to neighbors if not already sent
-            if b not in self.messages_sent:
-                heapq.heappush(self.messages_to_send, b)
-                self.messages_sent.add(b)
+            queue_message(b)
+        self.priorities_mask = priorities_mask
 
     def _formation_move(self) -> Move:
         """Move in zigzag pattern within assigned strip."""
+        strip_start = self.my_strip_start
+        strip_end = self.my_strip_end
+        current_x, current_y = self.position
+
         # First, go to assigned strip if not there yet
         if not self.at_strip:
             # Move to top of assigned strip
-            target_x = self.my_strip_start + self.strip_width / 2
+            target_x = strip_start + self.strip_width / 2
             target_y = 0
 
             # Check if we've arrived
-            if (
-                abs(self.position[0] - target_x) < 0.5
-                and abs(self.position[1] - target_y) < 0.5
-            ):
+            if abs(current_x - target_x) < 0.5 and abs(current_y - target_y) < 0.5:
                 self.at_strip = True
                 # Start at top-left corner
-                return Move(*self.move_towards(self.my_strip_start, 0))
+                return Move(*self.move_towards(strip_start, 0))
 
             return Move(*self.move_towards(target_x, target_y))
 
         # Now do zigzag within strip
-        current_x = self.position[0]
-
         # Zigzag pattern:
         # Row 0: sweep right (start to end)
         # Row 1: sweep left (end to start)
@@ -193,7 +198,7 @@ class Player7(Player):
         # Check if we've completed current row
         if sweep_right:
             # Sweeping right: check if reached right edge
-            if current_x >= self.my_strip_end - 0.5:
+            if current_x >= strip_end - 0.5:
                 # Move to next row
                 self.sweep_row += 1
                 target_row_y = self.sweep_row * self.row_height
@@ -202,17 +207,17 @@ class Player7(Player):
                 if target_row_y >= c.Y:
                     # Reset to top
                     self.sweep_row = 0
-                    return Move(*self.move_towards(self.my_strip_start, 0))
+                    return Move(*self.move_towards(strip_start, 0))
 
                 # Move down to next row at right edge
-                return Move(*self.move_towards(self.my_strip_end, target_row_y))
+                return Move(*self.move_towards(strip_end, target_row_y))
             else:
                 # Continue sweeping right
-                target_x = min(current_x + c.MAX_DISTANCE_KM, self.my_strip_end)
+                target_x = min(current_x + c.MAX_DISTANCE_KM, strip_end)
                 return Move(*self.move_towards(target_x, target_row_y))
         else:
             # Sweeping left: check if reached left edge
-            if current_x <= self.my_strip_start + 0.5:
+            if current_x <= strip_start + 0.5:
                 # Move to next row
                 self.sweep_row += 1
                 target_row_y = self.sweep_row * self.row_height
@@ -221,11 +226,11 @@ class Player7(Player):
                 if target_row_y >= c.Y:
                     # Reset to top
                     self.sweep_row = 0
-                    return Move(*self.move_towards(self.my_strip_end, 0))
+                    return Move(*self.move_towards(strip_end, 0))
 
                 # Move down to next row at left edge
-                return Move(*self.move_towards(self.my_strip_start, target_row_y))
+                return Move(*self.move_towards(strip_start, target_row_y))
             else:
                 # Continue sweeping left
-                target_x = max(current_x - c.MAX_DISTANCE_KM, self.my_strip_start)
+                target_x = max(current_x - c.MAX_DISTANCE_KM, strip_start)
                 return Move(*self.move_towards(target_x, target_row_y))
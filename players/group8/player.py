@@ -1,3 +1,5 @@
+from bisect import bisect_left
+from collections import deque
 from random import random
 
 from core.action import Action, Move, Obtain, Release
@@ -16,6 +18,7 @@ TARGET_REACHED_DELTA = 5.0
 RAIN_COUNTDOWN_START = 990
 CHECKED_ANIMAL_RADIUS = 3
 CHECKED_ANIMAL_EXPIRY_TURNS = 50
+CHECKED_ANIMAL_SWEEP_TURNS = CHECKED_ANIMAL_EXPIRY_TURNS // 2
 MAX_RECENT_UPDATES = 4
 MAX_ENCODED_SPECIES_ID = 64
 BASE_PICKUP_PROBABILITY_BOOST = 0.1
@@ -23,11 +26,26 @@ OPPOSITE_GENDER_IN_ARK_MULTIPLIER = 5.0
 OPPOSITE_GENDER_IN_FLOCK_MULTIPLIER = 3.0
 MIN_RARITY_FACTOR = 2.0
 RELEASE_DISTANCE_FROM_ARK = 50.0
+TARGET_REACHED_DELTA_SQ = TARGET_REACHED_DELTA * TARGET_REACHED_DELTA
+RELEASE_DISTANCE_FROM_ARK_SQ = RELEASE_DISTANCE_FROM_ARK * RELEASE_DISTANCE_FROM_ARK
 
+# (state_code, species_id) for every message byte
+MESSAGE_FIELDS = tuple((msg % 4, msg // 4) for msg in range(256))
 
-def distance(x1: float, y1: float, x2: float, y2: float) -> float:
-    """Calculate Euclidean distance between two points."""
-    return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+# Cell offsets within CHECKED_ANIMAL_RADIUS (Manhattan distance) of a cell
+CHECKED_ANIMAL_OFFSETS = tuple(
+    (dx, dy)
+    for dx in range(-CHECKED_ANIMAL_RADIUS, CHECKED_ANIMAL_RADIUS + 1)
+    for dy in range(-CHECKED_ANIMAL_RADIUS, CHECKED_ANIMAL_RADIUS + 1)
+    if abs(dx) + abs(dy) <= CHECKED_ANIMAL_RADIUS
+)
+
+
+def sqdist(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Calculate squared Euclidean distance between two points."""
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy
 
 
 class Player8(Player):
@@ -56,32 +74,45 @@ class Player8(Player):
         )
         self.target_position = self.sector_manager.get_random_position_in_sector()
 
-        # Internal ark state tracking: {species_id: (has_male, has_female)}
-        self.ark_state: dict[int, tuple[bool, bool]] = {}
-        self.recent_updates: list[tuple[int, int, int]] = []
+        # Species populations indexed by species_id (keys are "a", "b", ...)
+        self.pop_by_species = [1] * max(
+            MAX_ENCODED_SPECIES_ID, len(self.species_populations)
+        )
+        for letter, population in self.species_populations.items():
+            self.pop_by_species[ord(letter) - ord("a")] = population
+
+        # Internal ark state tracking: state code (bit 0=male, bit 1=female)
+        # indexed by species_id
+        self.ark_state = bytearray(
+            max(MAX_ENCODED_SPECIES_ID, len(self.species_populations))
+        )
+        # Last (species_id, state_code) updates to broadcast, oldest first
+        self.recent_updates: deque[tuple[int, int]] = deque(maxlen=MAX_RECENT_UPDATES)
+        self._recent_update_keys: set[tuple[int, int]] = set()
+        # Bumped whenever ark_state changes, to invalidate derived caches
+        self.ark_state_epoch = 0
+        # Bit species_id is set if that gender is in the ark / our flock
+        self.ark_male_mask = 0
+        self.ark_female_mask = 0
+        self.flock_male_mask = 0
+        self.flock_female_mask = 0
+
+        # Pickup probabilities by (species_id, gender), valid for one
+        # (ark_state_epoch, flock_male_mask, flock_female_mask) triple
+        self._prob_cache: dict[tuple[int, Gender], float] = {}
+        self._prob_cache_key: tuple[int, int, int] | None = None
 
         # Track animals we've checked for gender (to ignore in adjacent cells)
         self.checked_animals: dict[tuple[int, int, int], int] = {}
 
+        # Own cell view for the current turn, resolved lazily by _get_my_cell
+        self._my_cell: CellView | None = None
+
         # State for handling rare animal pickup when flock is full
         self.pending_obtain: Animal | None = None
 
     # Ark state tracking and messaging
 
-    def _get_state_code(self, species_id: int) -> int:
-        """Get state code for a species: 0=none, 1=male, 2=female, 3=both."""
-        if species_id not in self.ark_state:
-            return 0
-
-        has_male, has_female = self.ark_state[species_id]
-        if has_male and has_female:
-            return 3
-        elif has_male:
-            return 1
-        elif has_female:
-            return 2
-        return 0
-
     def _update_ark_state_from_view(self):
         """Update internal ark state from ark_view when at ark."""
         if self.ark_view is None:
@@ -89,62 +120,63 @@ class Player8(Player):
 
         for animal in self.ark_view.animals:
             sid = animal.species_id
-            if sid not in self.ark_state:
-                self.ark_state[sid] = (False, False)
-
-            has_male, has_female = self.ark_state[sid]
-
             if animal.gender == Gender.Male:
-                has_male = True
+                self._merge_ark_state(sid, 1)
             elif animal.gender == Gender.Female:
-                has_female = True
-
-            self.ark_state[sid] = (has_male, has_female)
+                self._merge_ark_state(sid, 2)
 
             # Add to recent updates
-            state_code = self._get_state_code(sid)
-            update = (sid, state_code, self.current_turn)
-            if update not in self.recent_updates:
-                self.recent_updates.append(update)
-                if len(self.recent_updates) > MAX_RECENT_UPDATES:
-                    self.recent_updates.pop(0)
+            self._add_recent_update(sid, self.ark_state[sid])
 
-    def _decode_state_code(self, state_code: int) -> tuple[bool, bool]:
-        """Decode state code into (has_male, has_female)."""
-        return (state_code in [1, 3], state_code in [2, 3])
+    def _add_recent_update(self, species_id: int, state_code: int):
+        """Queue an update for broadcasting unless it is already queued."""
+        update = (species_id, state_code)
+        if update in self._recent_update_keys:
+            return
 
-    def _update_ark_state_from_msg(self, msg: int):
-        """Update internal ark state from decoded message."""
-        if msg == 0:
+        if len(self.recent_updates) == MAX_RECENT_UPDATES:
+            self._recent_update_keys.discard(self.recent_updates[0])
+        self.recent_updates.append(update)
+        self._recent_update_keys.add(update)
+
+    def _merge_ark_state(self, species_id: int, state_code: int):
+        """Merge a state code into the ark state, keeping masks and epoch in sync."""
+        current = self.ark_state[species_id]
+        if not state_code & ~current:
             return
 
-        state_code = msg % 4
-        species_id = msg // 4
+        self.ark_state[species_id] = current | state_code
+        self.ark_state_epoch += 1
+        if state_code & 1:
+            self.ark_male_mask |= 1 << species_id
+        if state_code & 2:
+            self.ark_female_mask |= 1 << species_id
 
-        # Decode state
-        reported_male, reported_female = self._decode_state_code(state_code)
+    def _update_flock_masks(self):
+        """Rebuild the flock gender masks from the current flock."""
+        male_mask = female_mask = 0
+        for animal in self.flock:
+            if animal.gender == Gender.Male:
+                male_mask |= 1 << animal.species_id
+            elif animal.gender == Gender.Female:
+                female_mask |= 1 << animal.species_id
+        self.flock_male_mask = male_mask
+        self.flock_female_mask = female_mask
 
-        # Initialize if needed
-        if species_id not in self.ark_state:
-            self.ark_state[species_id] = (False, False)
+    def _update_ark_state_from_msg(self, msg: int):
+        """Update internal ark state from decoded message."""
+        if msg == 0:
+            return
 
-        current_male, current_female = self.ark_state[species_id]
+        state_code, species_id = MESSAGE_FIELDS[msg]
 
         # Merge reported genders with current state
-        current_male = current_male or reported_male
-        current_female = current_female or reported_female
-
-        self.ark_state[species_id] = (current_male, current_female)
+        self._merge_ark_state(species_id, state_code)
 
         # Add to recent updates if we received new information
         if state_code > 0:
             # Get the state code after merging (might be different from reported)
-            final_state_code = self._get_state_code(species_id)
-            update = (species_id, final_state_code, self.current_turn)
-            if update not in self.recent_updates:
-                self.recent_updates.append(update)
-                if len(self.recent_updates) > MAX_RECENT_UPDATES:
-                    self.recent_updates.pop(0)
+            self._add_recent_update(species_id, self.ark_state[species_id])
 
     def _encode_message(self) -> int:
         """Encode next update to broadcast."""
@@ -152,7 +184,7 @@ class Player8(Player):
             return 0
 
         # Cycle through recent updates
-        species_id, state_code, _ = self.recent_updates[
+        species_id, state_code = self.recent_updates[
             self.current_turn % len(self.recent_updates)
         ]
 
@@ -165,44 +197,36 @@ class Player8(Player):
     # Pickup and release logic
 
     def _get_my_cell(self) -> CellView:
-        """Get the cell view for the current position."""
-        xcell, ycell = tuple(map(int, self.position))
+        """Get the cell view for the current position (cached for the turn)."""
+        if self._my_cell is not None:
+            return self._my_cell
+
+        xcell = int(self.position[0])
+        ycell = int(self.position[1])
         if not self.sight.cell_is_in_sight(xcell, ycell):
             raise Exception(f"{self} failed to find own cell")
 
-        return self.sight.get_cellview_at(xcell, ycell)
+        self._my_cell = self.sight.get_cellview_at(xcell, ycell)
+        return self._my_cell
 
     def _species_has_both_genders_in_ark(self, species_id: int) -> bool:
         """Check if a species already has both male and female in the ark."""
-        if species_id not in self.ark_state:
-            return False
-        has_male, has_female = self.ark_state[species_id]
-        return has_male and has_female
+        return bool((self.ark_male_mask & self.ark_female_mask) >> species_id & 1)
 
     def _has_opposite_gender_in_ark(self, animal: Animal) -> bool:
         """Check if the opposite gender of this animal is in the ark."""
-        if animal.species_id not in self.ark_state:
-            return False
-
-        has_male, has_female = self.ark_state[animal.species_id]
         if animal.gender == Gender.Male:
-            return has_female
+            return bool(self.ark_female_mask >> animal.species_id & 1)
         elif animal.gender == Gender.Female:
-            return has_male
+            return bool(self.ark_male_mask >> animal.species_id & 1)
         return False
 
     def _has_opposite_gender_in_flock(self, animal: Animal) -> bool:
         """Check if the opposite gender of this animal is in the flock."""
-        for flock_animal in self.flock:
-            if flock_animal.species_id == animal.species_id:
-                if (
-                    animal.gender == Gender.Male
-                    and flock_animal.gender == Gender.Female
-                ) or (
-                    animal.gender == Gender.Female
-                    and flock_animal.gender == Gender.Male
-                ):
-                    return True
+        if animal.gender == Gender.Male:
+            return bool(self.flock_female_mask >> animal.species_id & 1)
+        elif animal.gender == Gender.Female:
+            return bool(self.flock_male_mask >> animal.species_id & 1)
         return False
 
     def _is_animal_no_longer_needed(self, animal: Animal) -> bool:
@@ -214,13 +238,10 @@ class Player8(Player):
             return True
 
         # Check if we already have this gender in the ark
-        if sid in self.ark_state:
-            has_male, has_female = self.ark_state[sid]
-            if animal.gender == Gender.Male and has_male:
-                return True
-            if animal.gender == Gender.Female and has_female:
-                return True
-
+        if animal.gender == Gender.Male:
+            return bool(self.ark_male_mask >> sid & 1)
+        if animal.gender == Gender.Female:
+            return bool(self.ark_female_mask >> sid & 1)
         return False
 
     def _find_animal_to_release(self) -> Animal | None:
@@ -230,24 +251,17 @@ class Player8(Player):
                 return animal
         return None
 
-    def _was_animal_checked_nearby(
-        self, x: int, y: int, species_id: int, radius: int = CHECKED_ANIMAL_RADIUS
-    ) -> bool:
+    def _was_animal_checked_nearby(self, x: int, y: int, species_id: int) -> bool:
         """Check if we've recently checked this animal's gender in a nearby cell."""
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                # Check Manhattan distance
-                if abs(dx) + abs(dy) > radius:
-                    continue
-
-                check_x = x + dx
-                check_y = y + dy
-                key = (check_x, check_y, species_id)
-
-                if key in self.checked_animals:
-                    visit_turn = self.checked_animals[key]
-                    if (self.current_turn - visit_turn) < CHECKED_ANIMAL_EXPIRY_TURNS:
-                        return True
+        checked = self.checked_animals
+        current_turn = self.current_turn
+        for dx, dy in CHECKED_ANIMAL_OFFSETS:
+            visit_turn = checked.get((x + dx, y + dy, species_id))
+            if (
+                visit_turn is not None
+                and current_turn - visit_turn < CHECKED_ANIMAL_EXPIRY_TURNS
+            ):
+                return True
         return False
 
     def _calculate_pickup_probability(self, animal: Animal) -> float:
@@ -255,7 +269,7 @@ class Player8(Player):
         sid = animal.species_id
 
         # Base probability: inverse of population
-        pop = self.species_populations.get(str(sid), 1)
+        pop = self.pop_by_species[sid]
         base_prob = 1.0 / (pop + 1) + BASE_PICKUP_PROBABILITY_BOOST
 
         # Check if already complete in ark
@@ -263,8 +277,11 @@ class Player8(Player):
             return 0.0
 
         # Check if already in flock (same gender)
-        for flock_animal in self.flock:
-            if flock_animal.species_id == sid and flock_animal.gender == animal.gender:
+        if animal.gender == Gender.Male:
+            if self.flock_male_mask >> sid & 1:
+                return 0.0
+        elif animal.gender == Gender.Female:
+            if self.flock_female_mask >> sid & 1:
                 return 0.0
 
         # Check if opposite gender exists
@@ -275,16 +292,23 @@ class Player8(Player):
 
         return base_prob
 
+    def _pickup_probabilities(self) -> dict[tuple[int, Gender], float]:
+        """Get the pickup probability cache, cleared if its inputs changed."""
+        key = (self.ark_state_epoch, self.flock_male_mask, self.flock_female_mask)
+        if key != self._prob_cache_key:
+            self._prob_cache_key = key
+            self._prob_cache.clear()
+        return self._prob_cache
+
     def _is_animal_much_rarer(self, animal: Animal) -> bool:
         """Check if an animal is much rarer than animals in current flock."""
         if len(self.flock) == 0:
             return True
 
-        animal_pop = self.species_populations.get(str(animal.species_id), 1)
-
+        pops = self.pop_by_species
+        animal_pop = pops[animal.species_id]
         min_flock_pop = min(
-            self.species_populations.get(str(flock_animal.species_id), 1)
-            for flock_animal in self.flock
+            pops[flock_animal.species_id] for flock_animal in self.flock
         )
 
         return animal_pop < min_flock_pop / MIN_RARITY_FACTOR
@@ -303,74 +327,86 @@ class Player8(Player):
         if self._has_other_helpers_in_cell(cellview) and random() < 0.5:
             return None
 
-        # Calculate probabilities for each animal
-        candidates = []
+        # Calculate probabilities for each animal, keeping a running total
+        probs = self._pickup_probabilities()
+        calculate = self._calculate_pickup_probability
+        candidates: list[Animal] = []
+        cumulative: list[float] = []
+        total_prob = 0.0
         for animal in cellview.animals:
-            prob = self._calculate_pickup_probability(animal)
+            key = (animal.species_id, animal.gender)
+            prob = probs.get(key)
+            if prob is None:
+                prob = probs[key] = calculate(animal)
             if prob > 0:
-                candidates.append((animal, prob))
+                total_prob += prob
+                candidates.append(animal)
+                cumulative.append(total_prob)
 
         if len(candidates) == 0:
             return None
+        if len(candidates) == 1:
+            return candidates[0]
 
-        # Select based on probability (weighted random)
-        total_prob = sum(prob for _, prob in candidates)
-        if total_prob == 0:
-            return None
-
+        # Select based on probability (weighted random): first candidate whose
+        # cumulative probability reaches r
         r = random() * total_prob
-        cumsum = 0
-        for animal, prob in candidates:
-            cumsum += prob
-            if r <= cumsum:
-                return animal
-
-        return candidates[0][0]
+        idx = bisect_left(cumulative, r)
+        if idx == len(candidates):
+            return candidates[0]
+        return candidates[idx]
 
     def _find_best_animal_to_chase(self) -> tuple[int, int] | None:
         """Find best desirable animal to chase (highest probability)."""
         best_prob = 0.0
         best_pos = None
 
+        # Hoist attribute lookups out of the sight loop
+        probs = self._pickup_probabilities()
+        calculate = self._calculate_pickup_probability
+        was_checked_nearby = self._was_animal_checked_nearby
+        my_id = self.id
+        unknown = Gender.Unknown
+
         for cellview in self.sight:
-            if len(cellview.animals) == 0:
+            animals = cellview.animals
+            if len(animals) == 0:
                 continue
 
-            if self._has_other_helpers_in_cell(cellview):
+            if any(h.id != my_id for h in cellview.helpers):
                 continue
 
             # Filter for desirable animals
-            for animal in cellview.animals:
-                if self._species_has_both_genders_in_ark(animal.species_id):
-                    continue
-
-                prob = self._calculate_pickup_probability(animal)
-                if prob == 0.0:
+            for animal in animals:
+                key = (animal.species_id, animal.gender)
+                prob = probs.get(key)
+                if prob is None:
+                    prob = probs[key] = calculate(animal)
+
+                # Only a strictly better candidate can change the target
+                if prob <= best_prob:
                     continue
 
                 # Skip if we've checked this animal's gender in a nearby cell
-                if animal.gender == Gender.Unknown:
-                    if self._was_animal_checked_nearby(
-                        cellview.x, cellview.y, animal.species_id
-                    ):
-                        continue
+                if animal.gender == unknown and was_checked_nearby(
+                    cellview.x, cellview.y, animal.species_id
+                ):
+                    continue
 
-                if prob > best_prob:
-                    best_prob = prob
-                    best_pos = (cellview.x, cellview.y)
+                best_prob = prob
+                best_pos = (cellview.x, cellview.y)
 
         return best_pos
 
     # Movement logic
 
-    def _distance_from_ark(self) -> float:
-        """Calculate distance from current position to ark."""
-        return distance(*self.position, *self.ark_position)
+    def _sqdist_from_ark(self) -> float:
+        """Calculate squared distance from current position to ark."""
+        return sqdist(*self.position, *self.ark_position)
 
     def _has_reached_target(self) -> bool:
         """Check if the player has reached the target position."""
-        dist = distance(*self.position, *self.target_position)
-        return dist <= TARGET_REACHED_DELTA
+        return sqdist(*self.position, *self.target_position) <= TARGET_REACHED_DELTA_SQ
 
     def _update_rain_state(self, was_raining: bool):
         """Update rain countdown state."""
@@ -383,8 +419,9 @@ class Player8(Player):
     def _mark_animals_as_checked(self):
         """Mark animals in current cell as checked for gender."""
         try:
-            xcell, ycell = tuple(map(int, self.position))
             cellview = self._get_my_cell()
+            xcell = cellview.x
+            ycell = cellview.y
             for animal in cellview.animals:
                 key = (xcell, ycell, animal.species_id)
                 self.checked_animals[key] = self.current_turn
@@ -392,16 +429,32 @@ class Player8(Player):
             # If we can't get cell view, skip marking
             pass
 
+    def _expire_checked_animals(self):
+        """Drop checked-animal stamps that can no longer suppress a chase."""
+        current_turn = self.current_turn
+        self.checked_animals = {
+            key: visit_turn
+            for key, visit_turn in self.checked_animals.items()
+            if current_turn - visit_turn < CHECKED_ANIMAL_EXPIRY_TURNS
+        }
+
     def check_surroundings(self, snapshot: HelperSurroundingsSnapshot):
         """Update state based on surroundings snapshot."""
         self.position = snapshot.position
         self.sight = snapshot.sight
+        self._my_cell = None
         was_raining = self.is_raining
         self.is_raining = snapshot.is_raining
         self.current_turn = snapshot.time_elapsed
 
         self._update_rain_state(was_raining)
-        self._mark_animals_as_checked()
+
+        # Noah never moves or picks up animals
+        if self.kind != Kind.Noah:
+            self._update_flock_masks()
+            if self.current_turn % CHECKED_ANIMAL_SWEEP_TURNS == 0:
+                self._expire_checked_animals()
+            self._mark_animals_as_checked()
 
         # Update ark state if at ark
         if snapshot.ark_view is not None:
@@ -421,8 +474,8 @@ class Player8(Player):
         if self.rain_countdown <= 0:
             return True
 
-        dist_from_ark = self._distance_from_ark()
-        return dist_from_ark >= self.rain_countdown
+        # rain_countdown is positive here, so squaring keeps the comparison
+        return self._sqdist_from_ark() >= self.rain_countdown * self.rain_countdown
 
     def _handle_pending_obtain(self) -> Action | None:
         """Handle pending obtain action if applicable."""
@@ -451,7 +504,7 @@ class Player8(Player):
             # Release the least valuable animal first
             worst_animal = max(
                 self.flock,
-                key=lambda a: self.species_populations.get(str(a.species_id), 1),
+                key=lambda a: self.pop_by_species[a.species_id],
             )
             self.pending_obtain = best_animal
             return Release(worst_animal)
@@ -469,21 +522,21 @@ class Player8(Player):
 
     def get_action(self, messages: list[Message]) -> Action | None:
         """Get next action based on current state and messages."""
-        # Decode messages and update ark state
-        for msg in messages:
-            self._update_ark_state_from_msg(msg.contents)
-
-        # Noah shouldn't do anything
+        # Noah shouldn't do anything; it reads the ark directly from its view
         if self.kind == Kind.Noah:
             return None
 
+        # Decode messages and update ark state
+        update_from_msg = self._update_ark_state_from_msg
+        for msg in messages:
+            update_from_msg(msg.contents)
+
         # Handle rain: head back if needed
         if self._should_head_back_to_ark():
             return Move(*self.move_towards(*self.ark_position))
 
         # Release an animal if it's no longer needed (only if far from ark)
-        dist_from_ark = self._distance_from_ark()
-        if dist_from_ark > RELEASE_DISTANCE_FROM_ARK:
+        if self._sqdist_from_ark() > RELEASE_DISTANCE_FROM_ARK_SQ:
             animal_to_release = self._find_animal_to_release()
             if animal_to_release is not None:
                 return Release(animal_to_release)
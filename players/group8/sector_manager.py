@@ -1,5 +1,6 @@
+import functools
 from random import choice, uniform
-from math import cos, sin, pi, atan2
+from math import cos, sin, pi
 
 import core.constants as c
 from core.views.player_view import Kind
@@ -11,6 +12,136 @@ SECTOR_INTEGRATION_STEPS = 200
 SECTOR_BINARY_SEARCH_ITERATIONS = 50
 SECTOR_OVERLAP_PERCENT = 0
 POSITION_GENERATION_ATTEMPTS = 100
+RAY_EPSILON = 1e-10
+
+# Simpson's rule weights (1, 4, 2, 4, ..., 4, 1) for SECTOR_INTEGRATION_STEPS
+SIMPSON_WEIGHTS = tuple(
+    1.0 if i in (0, SECTOR_INTEGRATION_STEPS) else 4.0 if i % 2 == 1 else 2.0
+    for i in range(SECTOR_INTEGRATION_STEPS + 1)
+)
+
+
+def _max_radius_at_angle(
+    ark_x: float, ark_y: float, angle: float, radius: float = MAX_SEARCH_RADIUS
+) -> float:
+    """Calculate the maximum radius at a given angle such that the point stays within grid bounds."""
+    cos_a = cos(angle)
+    sin_a = sin(angle)
+
+    # Distance along the ray to the grid edge it heads towards on each axis
+    # (radius if the ray is parallel to that axis)
+    if cos_a > RAY_EPSILON:
+        x_ray = (c.X - ark_x) / cos_a
+    elif cos_a < -RAY_EPSILON:
+        x_ray = -ark_x / cos_a
+    else:
+        x_ray = radius
+    if sin_a > RAY_EPSILON:
+        y_ray = (c.Y - ark_y) / sin_a
+    elif sin_a < -RAY_EPSILON:
+        y_ray = -ark_y / sin_a
+    else:
+        y_ray = radius
+
+    # Edges at or behind the ark don't limit the ray
+    return min(radius, x_ray if x_ray > 0 else radius, y_ray if y_ray > 0 else radius)
+
+
+def _calculate_sector_area(
+    ark_x: float,
+    ark_y: float,
+    start_angle: float,
+    end_angle: float,
+    radius: float = MAX_SEARCH_RADIUS,
+) -> float:
+    """Calculate the area of a sector clipped by grid boundaries using numerical integration."""
+    if start_angle > end_angle:
+        # Sector wraps around 0
+        area1 = _calculate_sector_area(ark_x, ark_y, start_angle, 2 * pi, radius)
+        area2 = _calculate_sector_area(ark_x, ark_y, 0, end_angle, radius)
+        return area1 + area2
+
+    dtheta = (end_angle - start_angle) / SECTOR_INTEGRATION_STEPS
+
+    area = 0.0
+    for i, weight in enumerate(SIMPSON_WEIGHTS):
+        r_max = _max_radius_at_angle(ark_x, ark_y, start_angle + i * dtheta, radius)
+        area += weight * (r_max * r_max) / 2.0
+
+    return area * dtheta / 3.0
+
+
+def _calculate_cumulative_area(
+    ark_x: float, ark_y: float, end_angle: float, radius: float = MAX_SEARCH_RADIUS
+) -> float:
+    """Calculate cumulative area from angle 0 to end_angle."""
+    if end_angle <= 0:
+        return 0.0
+    if end_angle >= 2 * pi:
+        return _calculate_sector_area(ark_x, ark_y, 0, 2 * pi, radius)
+
+    return _calculate_sector_area(ark_x, ark_y, 0, end_angle, radius)
+
+
+@functools.lru_cache(maxsize=32)
+def _find_equal_area_sectors(
+    ark_x: float, ark_y: float, num_sectors: int, radius: float = MAX_SEARCH_RADIUS
+) -> tuple[float, ...]:
+    """Find sector boundaries that divide the searchable area into equal parts.
+
+    Cached, since every helper on a team asks for the same boundaries. The
+    bisection probes integrate exactly rather than reading an interpolated
+    table: the search is sensitive enough that interpolation error moves
+    boundaries by tenths of a radian for large teams and edge arks.
+    """
+    if num_sectors == 0:
+        return (0, 2 * pi)
+
+    total_area = _calculate_sector_area(ark_x, ark_y, 0, 2 * pi, radius)
+    target_area_per_sector = total_area / num_sectors
+
+    boundaries = [0.0]
+
+    for i in range(num_sectors - 1):
+        target_cumulative = (i + 1) * target_area_per_sector
+        low = boundaries[-1]
+        high = boundaries[-1] + 2 * pi
+
+        # Binary search for angle where cumulative area equals target
+        for _ in range(SECTOR_BINARY_SEARCH_ITERATIONS):
+            mid = (low + high) / 2
+            mid_normalized = mid % (2 * pi)
+            test_cumulative = _calculate_cumulative_area(
+                ark_x, ark_y, mid_normalized, radius
+            )
+
+            if test_cumulative < target_cumulative:
+                low = mid
+            else:
+                high = mid
+
+            if abs(high - low) < 0.001:
+                break
+
+        next_boundary = (low + high) / 2 % (2 * pi)
+        next_boundary = round(next_boundary, 6)
+
+        # Handle wrap-around case
+        if next_boundary < boundaries[-1] and i < num_sectors - 2:
+            next_boundary = boundaries[-1] + (2 * pi - boundaries[-1]) / (
+                num_sectors - i
+            )
+            next_boundary = round(next_boundary, 6)
+
+        boundaries.append(next_boundary)
+
+    # Ensure last boundary is 2*pi
+    if abs(boundaries[-1] - 2 * pi) > 0.0001:
+        boundaries.append(2 * pi)
+    else:
+        boundaries[-1] = 2 * pi
+
+    return tuple(boundaries)
 
 
 class SectorManager:
@@ -32,135 +163,7 @@ class SectorManager:
         self.sector_end_angle: float = 2 * pi
 
         self._initialize_sector()
-
-    def _max_radius_at_angle(
-        self, angle: float, radius: float = MAX_SEARCH_RADIUS
-    ) -> float:
-        """Calculate the maximum radius at a given angle such that the point stays within grid bounds."""
-        ark_x, ark_y = self.ark_position
-        cos_a = cos(angle)
-        sin_a = sin(angle)
-
-        max_r = radius
-        epsilon = 1e-10
-
-        # X boundaries
-        if abs(cos_a) > epsilon:
-            if cos_a < 0:
-                r_to_x0 = -ark_x / cos_a
-                if r_to_x0 > 0:
-                    max_r = min(max_r, r_to_x0)
-            if cos_a > 0:
-                r_to_xmax = (c.X - ark_x) / cos_a
-                if r_to_xmax > 0:
-                    max_r = min(max_r, r_to_xmax)
-
-        # Y boundaries
-        if abs(sin_a) > epsilon:
-            if sin_a < 0:
-                r_to_y0 = -ark_y / sin_a
-                if r_to_y0 > 0:
-                    max_r = min(max_r, r_to_y0)
-            if sin_a > 0:
-                r_to_ymax = (c.Y - ark_y) / sin_a
-                if r_to_ymax > 0:
-                    max_r = min(max_r, r_to_ymax)
-
-        return max(0, max_r)
-
-    def _calculate_sector_area(
-        self, start_angle: float, end_angle: float, radius: float = MAX_SEARCH_RADIUS
-    ) -> float:
-        """Calculate the area of a sector clipped by grid boundaries using numerical integration."""
-        if start_angle > end_angle:
-            # Sector wraps around 0
-            area1 = self._calculate_sector_area(start_angle, 2 * pi, radius)
-            area2 = self._calculate_sector_area(0, end_angle, radius)
-            return area1 + area2
-
-        num_steps = SECTOR_INTEGRATION_STEPS
-        dtheta = (end_angle - start_angle) / num_steps
-
-        area = 0.0
-        for i in range(num_steps + 1):
-            angle = start_angle + i * dtheta
-            r_max = self._max_radius_at_angle(angle, radius)
-
-            # Simpson's rule weights: 1, 4, 2, 4, ..., 1
-            if i == 0 or i == num_steps:
-                weight = 1.0
-            elif i % 2 == 1:
-                weight = 4.0
-            else:
-                weight = 2.0
-
-            area += weight * (r_max**2) / 2.0
-
-        return area * dtheta / 3.0
-
-    def _calculate_cumulative_area(
-        self, end_angle: float, radius: float = MAX_SEARCH_RADIUS
-    ) -> float:
-        """Calculate cumulative area from angle 0 to end_angle."""
-        if end_angle <= 0:
-            return 0.0
-        if end_angle >= 2 * pi:
-            return self._calculate_sector_area(0, 2 * pi, radius)
-
-        return self._calculate_sector_area(0, end_angle, radius)
-
-    def _find_equal_area_sectors(
-        self, num_sectors: int, radius: float = MAX_SEARCH_RADIUS
-    ) -> list[float]:
-        """Find sector boundaries that divide the searchable area into equal parts."""
-        if num_sectors == 0:
-            return [0, 2 * pi]
-
-        total_area = self._calculate_sector_area(0, 2 * pi, radius)
-        target_area_per_sector = total_area / num_sectors
-
-        boundaries = [0.0]
-
-        for i in range(num_sectors - 1):
-            target_cumulative = (i + 1) * target_area_per_sector
-            low = boundaries[-1]
-            high = boundaries[-1] + 2 * pi
-
-            # Binary search for angle where cumulative area equals target
-            for _ in range(SECTOR_BINARY_SEARCH_ITERATIONS):
-                mid = (low + high) / 2
-                mid_normalized = mid % (2 * pi)
-                test_cumulative = self._calculate_cumulative_area(
-                    mid_normalized, radius
-                )
-
-                if test_cumulative < target_cumulative:
-                    low = mid
-                else:
-                    high = mid
-
-                if abs(high - low) < 0.001:
-                    break
-
-            next_boundary = (low + high) / 2 % (2 * pi)
-            next_boundary = round(next_boundary, 6)
-
-            # Handle wrap-around case
-            if next_boundary < boundaries[-1] and i < num_sectors - 2:
-                next_boundary = boundaries[-1] + (2 * pi - boundaries[-1]) / (
-                    num_sectors - i
-                )
-                next_boundary = round(next_boundary, 6)
-
-            boundaries.append(next_boundary)
-
-        # Ensure last boundary is 2*pi
-        if abs(boundaries[-1] - 2 * pi) > 0.0001:
-            boundaries.append(2 * pi)
-        else:
-            boundaries[-1] = 2 * pi
-
-        return boundaries
+        self._cache_sector_rays()
 
     def _initialize_sector(self):
         """Initialize sector angles for this helper using equal-area sectors."""
@@ -177,7 +180,7 @@ class SectorManager:
             self.sector_end_angle = 2 * pi
             return
 
-        boundaries = self._find_equal_area_sectors(num_actual_helpers)
+        boundaries = _find_equal_area_sectors(*self.ark_position, num_actual_helpers)
         sector_index = self.helper_id - 1  # Subtract 1 because id 0 is Noah
 
         if 0 <= sector_index < len(boundaries) - 1:
@@ -197,40 +200,66 @@ class SectorManager:
         self.sector_start_angle = (start_angle - overlap) % (2 * pi)
         self.sector_end_angle = (end_angle + overlap) % (2 * pi)
 
+    def _cache_sector_rays(self):
+        """Precompute the sector's bounding rays for is_in_sector."""
+        start_angle = self.sector_start_angle
+        end_angle = self.sector_end_angle
+        sector_span = end_angle - start_angle
+        if sector_span < 0:
+            sector_span += 2 * pi
+
+        self._full_sector = sector_span >= 2 * pi
+        self._reflex_sector = sector_span > pi
+        self._start_ray = (cos(start_angle), sin(start_angle))
+        self._end_ray = (cos(end_angle), sin(end_angle))
+
     def is_in_sector(self, x: float, y: float) -> bool:
         """Check if a point is in this helper's sector."""
+        if self._full_sector:
+            return True
+
         dx = x - self.ark_position[0]
         dy = y - self.ark_position[1]
-        angle = atan2(dy, dx)
-        if angle < 0:
-            angle += 2 * pi
+        start_cos, start_sin = self._start_ray
+        end_cos, end_sin = self._end_ray
 
-        # Handle wrap-around case
-        if self.sector_start_angle > self.sector_end_angle:
-            return angle >= self.sector_start_angle or angle <= self.sector_end_angle
-        else:
-            return self.sector_start_angle <= angle <= self.sector_end_angle
+        # Counter-clockwise of the start ray and clockwise of the end ray
+        after_start = start_cos * dy - start_sin * dx >= 0
+        before_end = end_cos * dy - end_sin * dx <= 0
+
+        # A sector wider than a half-turn is the union of the two half-planes
+        if self._reflex_sector:
+            return after_start or before_end
+        return after_start and before_end
 
     def get_random_position_in_sector(self) -> tuple[float, float]:
         """Generate a random position within sector and within max search radius of ark."""
+        ark_x, ark_y = self.ark_position
+        x_max = c.X - 1
+        y_max = c.Y - 1
+        start_angle = self.sector_start_angle
+        end_angle = self.sector_end_angle
+        wraps = start_angle > end_angle
+
         for _ in range(POSITION_GENERATION_ATTEMPTS):
             # Generate random angle within sector
-            if self.sector_start_angle > self.sector_end_angle:
-                # Wraps around
-                angle1 = uniform(self.sector_start_angle, 2 * pi)
-                angle2 = uniform(0, self.sector_end_angle)
+            if wraps:
+                angle1 = uniform(start_angle, 2 * pi)
+                angle2 = uniform(0, end_angle)
                 angle = choice([angle1, angle2])
             else:
-                angle = uniform(self.sector_start_angle, self.sector_end_angle)
+                angle = uniform(start_angle, end_angle)
 
             dist = uniform(0, MAX_SEARCH_RADIUS)
-            ark_x, ark_y = self.ark_position
             x = ark_x + dist * cos(angle)
             y = ark_y + dist * sin(angle)
 
-            # Clamp to grid boundaries
-            x = max(0, min(c.X - 1, x))
-            y = max(0, min(c.Y - 1, y))
+            # Inside the grid the sampled angle already lies in the sector;
+            # only points moved by clamping to the grid need rechecking
+            if 0 <= x <= x_max and 0 <= y <= y_max:
+                return (x, y)
+            x = max(0, min(x_max, x))
+            y = max(0, min(y_max, y))
 
             if self.is_in_sector(x, y):
                 return (x, y)
@@ -238,7 +267,6 @@ class SectorManager:
         # Fallback: return a position within max search radius
         angle = uniform(0, 2 * pi)
         dist = uniform(0, MAX_SEARCH_RADIUS)
-        ark_x, ark_y = self.ark_position
-        x = max(0, min(c.X - 1, ark_x + dist * cos(angle)))
-        y = max(0, min(c.Y - 1, ark_y + dist * sin(angle)))
+        x = max(0, min(x_max, ark_x + dist * cos(angle)))
+        y = max(0, min(y_max, ark_y + dist * sin(angle)))
         return (x, y)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import math
-from random import choice, random
+from functools import reduce
+from itertools import islice
+from operator import or_
+from random import random, randrange
 from typing import Any
 
 from core.action import Action, Move, Obtain
@@ -16,6 +19,11 @@ def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     return (abs(x1 - x2) ** 2 + abs(y1 - y2) ** 2) ** 0.5
 
 
+def _random_from_set(items: set[Any]) -> Any:
+    """Pick a uniformly random element of a set without copying it."""
+    return next(islice(items, randrange(len(items)), None))
+
+
 class Player9(Player):
     FLOCK_CAPACITY = 4
 
@@ -32,6 +40,7 @@ class Player9(Player):
 
         self.is_raining = False
         self.hellos_received: list[int] = []
+        self._hello_bit = 1 << (id % 8)
         self.num_helpers = num_helpers
 
         # Initialize ark_inventory so the linter is happy.
@@ -45,6 +54,11 @@ class Player9(Player):
             species_populations.keys(), key=lambda s: species_populations.get(s, 0)
         )
 
+        # Species letter ("a", "b", ...) indexed by species_id
+        self._species_letters: tuple[str, ...] = tuple(
+            chr(sid + ord("a")) for sid in range(len(species_populations))
+        )
+
         # Create a mapping for 1-byte messages
         self.int_to_species: dict[int, str] = {
             i + 1: species for i, species in enumerate(self.rarity_order)
@@ -59,6 +73,9 @@ class Player9(Player):
             self.sweep_angle = 2.0 * math.pi * idx / num_helpers
         else:
             self.sweep_angle = 0.0
+        # Unit sweep direction, only recomputed when we bounce off a wall
+        self._sweep_cos = math.cos(self.sweep_angle)
+        self._sweep_sin = math.sin(self.sweep_angle)
 
         if self.kind == Kind.Noah:
             print("I am Noah. I will coordinate.")
@@ -121,8 +138,9 @@ class Player9(Player):
         target_animal = None
         # Priority 1: Get the animal Noah wants
         if self.noah_target_species:
+            species_letters = self._species_letters
             for animal in cellview.animals:
-                species_name = str(animal).split(" ")[0]
+                species_name = species_letters[animal.species_id]
                 if species_name == self.noah_target_species:
                     target_animal = animal
                     break
@@ -131,50 +149,53 @@ class Player9(Player):
             return target_animal
 
         # Priority 2: No target, or target not here. Just grab one.
-        return choice(tuple(cellview.animals))
+        return _random_from_set(cellview.animals)
 
     def _find_best_animal_to_chase(self) -> tuple[int, int] | None:
         """(Helper logic) Finds the best animal to chase in sight."""
-        target_cells: list[tuple[float, tuple[int, int]]] = []
-        any_cells: list[tuple[float, tuple[int, int]]] = []
-
+        # Closest cell with our target, and closest cell with any animal
+        best_target_dist = best_any_dist = math.inf
+        best_target_pos: tuple[int, int] | None = None
+        best_any_pos: tuple[int, int] | None = None
+
+        pos_x, pos_y = self.position
+        target_species = self.noah_target_species
+        species_letters = self._species_letters
         for cellview in self.sight:
             if not cellview.animals:
                 continue
 
-            dist = distance(*self.position, cellview.x, cellview.y)
+            # Squared distance is enough to rank cells
+            dx = pos_x - cellview.x
+            dy = pos_y - cellview.y
+            dist = dx * dx + dy * dy
             has_target = False
 
-            if self.noah_target_species:
+            if target_species:
                 for animal in cellview.animals:
-                    species_name = str(animal).split(" ")[0]
-                    if species_name == self.noah_target_species:
-                        target_cells.append((dist, (cellview.x, cellview.y)))
+                    if species_letters[animal.species_id] == target_species:
                         has_target = True
                         break
 
-            if not has_target:
-                any_cells.append((dist, (cellview.x, cellview.y)))
+            if has_target:
+                if dist < best_target_dist:
+                    best_target_dist = dist
+                    best_target_pos = (cellview.x, cellview.y)
+            elif dist < best_any_dist:
+                best_any_dist = dist
+                best_any_pos = (cellview.x, cellview.y)
 
         # Priority 1: Go for the closest cell that has our target
-        if target_cells:
-            target_cells.sort(key=lambda x: x[0])  # Sort by distance
-            return target_cells[0][1]  # Return (x, y)
-
         # Priority 2: No target in sight. Go for the closest *any* animal.
-        if any_cells:
-            any_cells.sort(key=lambda x: x[0])  # Sort by distance
-            return any_cells[0][1]  # Return (x, y)
-
-        return None
+        return best_target_pos or best_any_pos
 
     # ---------- Sweep & Bounce Logic (No Jitter) ----------
 
     def _get_sweep_move(self) -> tuple[float, float]:
         old_x, old_y = self.position
 
-        base_dx = math.cos(self.sweep_angle)
-        base_dy = math.sin(self.sweep_angle)
+        base_dx = self._sweep_cos
+        base_dy = self._sweep_sin
 
         reflected = False
         if (old_x < 5.0 and base_dx < 0.0) or (old_x > 995.0 and base_dx > 0.0):
@@ -187,19 +208,12 @@ class Player9(Player):
 
         if reflected:
             self.sweep_angle = math.atan2(base_dy, base_dx)
+            self._sweep_cos = base_dx
+            self._sweep_sin = base_dy
 
-        dx = base_dx
-        dy = base_dy
-
-        length = math.sqrt(dx * dx + dy * dy)
-        if length == 0.0:
-            return self._get_random_move()
-
-        dx /= length
-        dy /= length
-
-        new_x = old_x + dx
-        new_y = old_y + dy
+        # (base_dx, base_dy) is already a unit vector
+        new_x = old_x + base_dx
+        new_y = old_y + base_dy
 
         if not self.can_move_to(new_x, new_y):
             # The deterministic sweep is illegal, so we are stuck.
@@ -233,11 +247,9 @@ class Player9(Player):
 
             # Simple "hello" protocol
             if len(self.hellos_received) == 0:
-                msg = 1 << (self.id % 8)
+                msg = self._hello_bit
             else:
-                msg = 0
-                for hello in self.hellos_received:
-                    msg |= hello
+                msg = reduce(or_, self.hellos_received, 0)
                 self.hellos_received = []
 
             if not self.is_message_valid(msg):
@@ -256,19 +268,20 @@ class Player9(Player):
 
         # --- HELPER'S LOGIC ---
 
-        # 1. Listen for Noah's broadcast
-        for msg in messages:
-            if msg.from_helper.kind == Kind.Noah:
-                self.noah_target_species = self.int_to_species.get(msg.contents)
-                break
-
-        # 2. Handle "Hello" messages
+        # 1. Listen for Noah's broadcast and handle "Hello" messages
+        noah_seen = False
         for msg in messages:
-            if msg.from_helper.kind == Kind.Helper:
+            sender_kind = msg.from_helper.kind
+            if sender_kind == Kind.Noah:
+                # Only Noah's first broadcast counts
+                if not noah_seen:
+                    self.noah_target_species = self.int_to_species.get(msg.contents)
+                    noah_seen = True
+            elif sender_kind == Kind.Helper:
                 if 1 << (msg.from_helper.id % 8) == msg.contents:
                     self.hellos_received.append(msg.contents)
 
-        # 3. Decide on an Action
+        # 2. Decide on an Action
 
         # Priority 1: Safety / Flood Awareness / Full Inventory
         if self.is_raining:
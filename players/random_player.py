@@ -1,4 +1,8 @@
-from random import random, choice
+from functools import reduce
+from itertools import islice
+from operator import or_
+from random import random, randrange
+from typing import Any
 
 from core.action import Action, Move, Obtain
 from core.message import Message
@@ -8,8 +12,12 @@ from core.views.player_view import Kind
 from core.views.cell_view import CellView
 
 
-def distance(x1: float, y1: float, x2: float, y2: float) -> float:
-    return (abs(x1 - x2) ** 2 + abs(y1 - y2) ** 2) ** 0.5
+RANDOM_MOVE_ATTEMPTS = 8
+
+
+def _random_from_set(items: set[Any]) -> Any:
+    """Pick a uniformly random element of a set without copying it."""
+    return next(islice(items, randrange(len(items)), None))
 
 
 class RandomPlayer(Player):
@@ -27,6 +35,8 @@ class RandomPlayer(Player):
 
         self.is_raining = False
         self.hellos_received = []
+        # my "hello": my id bit set
+        self._hello_bit = 1 << (self.id % 8)
 
     def _get_my_cell(self) -> CellView:
         xcell, ycell = tuple(map(int, self.position))
@@ -39,11 +49,15 @@ class RandomPlayer(Player):
         closest_animal = None
         closest_dist = -1
         closest_pos = None
+        pos_x, pos_y = self.position
         for cellview in self.sight:
             if len(cellview.animals) > 0:
-                dist = distance(*self.position, cellview.x, cellview.y)
+                # compare squared distances, the closest cell is the same
+                dx = pos_x - cellview.x
+                dy = pos_y - cellview.y
+                dist = dx * dx + dy * dy
                 if closest_animal is None or dist < closest_dist:
-                    closest_animal = choice(tuple(cellview.animals))
+                    closest_animal = _random_from_set(cellview.animals)
                     closest_dist = dist
                     closest_pos = (cellview.x, cellview.y)
 
@@ -51,12 +65,14 @@ class RandomPlayer(Player):
 
     def _get_random_move(self) -> tuple[float, float]:
         old_x, old_y = self.position
-        dx, dy = random() - 0.5, random() - 0.5
 
-        while not (self.can_move_to(old_x + dx, old_y + dy)):
+        for _ in range(RANDOM_MOVE_ATTEMPTS):
             dx, dy = random() - 0.5, random() - 0.5
+            if self.can_move_to(old_x + dx, old_y + dy):
+                return old_x + dx, old_y + dy
 
-        return old_x + dx, old_y + dy
+        # boxed in by the map edge, fall back to a step towards the ark
+        return self.move_towards(*self.ark_position)
 
     def check_surroundings(self, snapshot: HelperSurroundingsSnapshot) -> int:
         # I can't trust that my internal position and flock matches the simulators
@@ -71,13 +87,11 @@ class RandomPlayer(Player):
         # if I didn't receive any messages, broadcast "hello"
         # a "hello" message is when a player's id bit is set
         if len(self.hellos_received) == 0:
-            msg = 1 << (self.id % 8)
+            msg = self._hello_bit
         else:
             # else, acknowledge all "hello"'s I got last turn
             # do this with a bitwise OR of all IDs I got
-            msg = 0
-            for hello in self.hellos_received:
-                msg |= hello
+            msg = reduce(or_, self.hellos_received, 0)
             self.hellos_received = []
 
         if not self.is_message_valid(msg):
@@ -107,7 +121,7 @@ class RandomPlayer(Player):
         if len(cellview.animals) > 0:
             # This means the random_player will even attempt to
             # (unsuccessfully) obtain animals in other helpers' flocks
-            random_animal = choice(tuple(cellview.animals))
+            random_animal = _random_from_set(cellview.animals)
             return Obtain(random_animal)
 
         # If I see any animals, I'll chase the closest one